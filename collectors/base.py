@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
+from collectors.bloom import BloomFilter
 from config import Config
 from storage.models import RawReport
 
@@ -24,7 +25,13 @@ class BaseCollector(ABC):
         self.config = config
         self.report_queue = report_queue
         self.is_running = False
-        self._seen_ids: set[str] = set()
+        # Per-session dedupe: ~60 KB of bits instead of a set of strings
+        self._seen_ids = BloomFilter(capacity=50_000, error_rate=0.01)
+        # Trusted map sources keep reports longer than social feeds
+        is_trusted = self.name in ("iceout", "stopice")
+        self._max_age = timedelta(hours=6) if is_trusted else timedelta(
+            seconds=config.report_max_age_seconds
+        )
 
     @abstractmethod
     async def collect(self) -> list[RawReport]:
@@ -41,12 +48,6 @@ class BaseCollector(ABC):
         if source_id in self._seen_ids:
             return False
         self._seen_ids.add(source_id)
-        # Cap the in-memory set to avoid unbounded growth
-        # Reduced from 10K to 2K to save memory on low-RAM servers
-        if len(self._seen_ids) > 2_000:
-            # Keep the most recent half
-            trimmed = list(self._seen_ids)[-1_000:]
-            self._seen_ids = set(trimmed)
         return True
 
     async def run(self) -> None:
@@ -71,30 +72,40 @@ class BaseCollector(ABC):
                 backoff = 1
                 consecutive_failures = 0
 
-                # Pre-filter stale reports so they never hit the queue
-                now = datetime.now(timezone.utc)
-                is_trusted = self.name in ("iceout", "stopice")
-                max_age = timedelta(hours=6) if is_trusted else timedelta(
-                    seconds=self.config.report_max_age_seconds
-                )
-                fresh = [r for r in reports if (now - r.timestamp) <= max_age]
+                # Pre-filter stale reports so they never hit the queue.
+                # collected_at is the collector's cycle clock, so no
+                # extra wall-clock read is needed here.
+                max_age = self._max_age
+                fresh = [r for r in reports if (r.collected_at - r.timestamp) <= max_age]
                 stale_count = len(reports) - len(fresh)
 
-                for report in fresh:
-                    await self.report_queue.put(report)
-
-                if fresh:
-                    msg = "[%s] Collected %d new reports"
-                    if stale_count:
-                        msg += f" (skipped {stale_count} stale)"
-                    logger.info(msg, self.name, len(fresh))
-                elif stale_count:
+                # put_nowait skips a scheduler hop per report; only await
+                # when a bounded queue is actually full
+                for i, report in enumerate(fresh):
+                    try:
+                        self.report_queue.put_nowait(report)
+                    except asyncio.QueueFull:
+                        for pending in fresh[i:]:
+                            await self.report_queue.put(pending)
+                        break
+
+                if fresh and stale_count:
                     logger.info(
+                        "[%s] Collected %d new reports (skipped %d stale)",
+                        self.name, len(fresh), stale_count,
+                    )
+                elif fresh:
+                    logger.info(
+                        "[%s] Collected %d new reports", self.name, len(fresh),
+                    )
+                # Idle cycles dominate steady state; keep them out of INFO
+                elif stale_count:
+                    logger.debug(
                         "[%s] Cycle %d complete, no fresh reports (%d stale skipped)",
                         self.name, cycle_count, stale_count,
                     )
                 else:
-                    logger.info("[%s] Cycle %d complete, no new reports", self.name, cycle_count)
+                    logger.debug("[%s] Cycle %d complete, no new reports", self.name, cycle_count)
 
             except asyncio.CancelledError:
                 logger.info("[%s] Collector cancelled", self.name)
@@ -0,0 +1,71 @@
+"""Fixed-size Bloom filter for per-session source_id deduplication.
+
+A plain ``set`` of source IDs costs 50+ bytes of object overhead per
+string and needs periodic trimming to stay bounded.  A Bloom filter
+answers "have we seen this?" with a handful of hash ops and bit loads,
+in a single preallocated ``bytearray``, with a tunable false-positive
+rate and no false negatives.
+
+Indices are derived with Kirsch–Mitzenmacher double hashing: one
+``blake2b`` digest is split into two 64-bit halves ``h1``/``h2`` and the
+*i*-th probe is ``(h1 + i * h2) % m``.
+"""
+
+from __future__ import annotations
+
+import math
+from hashlib import blake2b
+
+
+class BloomFilter:
+    """Bit-array Bloom filter sized for *capacity* items at *error_rate*.
+
+    Once more than *capacity* items have been added the filter clears
+    itself and starts over, so the false-positive rate never drifts
+    above the configured target.
+    """
+
+    def __init__(self, capacity: int = 50_000, error_rate: float = 0.01):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Optimal bit count and probe count for the target FPR
+        m = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_bits = (m + 7) // 8 * 8
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray(self._num_bits // 8)
+        self._count = 0
+
+    def _indices(self, key: str):
+        digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self._num_bits
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % m
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for idx in self._indices(key):
+            if not bits[idx >> 3] & (1 << (idx & 7)):
+                return False
+        return True
+
+    def add(self, key: str) -> None:
+        if self._count >= self.capacity:
+            self.clear()
+        bits = self._bits
+        for idx in self._indices(key):
+            bits[idx >> 3] |= 1 << (idx & 7)
+        self._count += 1
+
+    def clear(self) -> None:
+        self._bits = bytearray(self._num_bits // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
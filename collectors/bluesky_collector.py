@@ -12,22 +12,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import sys
+from bisect import bisect_right
 from datetime import datetime, timezone
 from typing import Any
 
 import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
 
 from collectors.base import BaseCollector
+from collectors.http_session import get_session
 from storage.models import RawReport
 
 logger = logging.getLogger(__name__)
 
 # ── Bluesky API endpoints ─────────────────────────────────────────────
 BSKY_PUBLIC_API = "https://public.api.bsky.app"
+_JSON_HEADERS = {"Accept": "application/json"}
 
 # ── ICE keyword regex (universal — not locale-specific) ──────────────
-import re
-
 ICE_KEYWORDS_RE = re.compile(
     r"\b(?:"
     r"ice\b|"
@@ -42,8 +47,7 @@ ICE_KEYWORDS_RE = re.compile(
     r"rapid\s+response|"
     r"community\s+alert|"
     r"unmarked\s+(?:van|vehicle|car|suv)"
-    r")",
-    re.IGNORECASE,
+    r")"
 )
 
 
@@ -54,34 +58,74 @@ class BlueskyCollector(BaseCollector):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._session: aiohttp.ClientSession | None = None
         self._search_index = 0
+        self._did_cache: dict[str, str] = {}
+        # Token bucket: only blocks once we actually exceed 30 req/min
+        self._bucket = AsyncLimiter(max_rate=30, time_period=60)
         # Build locale-aware geo regex and account sets
         locale = self.config.locale
-        self._geo_re = locale.build_geo_regex()
+        # Patterns are lowercase-only; callers lowercase the text once
+        self._geo_re = locale.build_geo_regex(ignore_case=False)
+        # One pass over the text reports both keyword classes via lastgroup
+        self._relevance_re = re.compile(
+            rf"(?P<ice>{ICE_KEYWORDS_RE.pattern})|(?P<geo>{self._geo_re.pattern})"
+        )
         self._search_queries = list(locale.bluesky_search_queries)
         self._monitored_accounts = list(locale.bluesky_monitored_accounts)
-        self._focused_accounts = {h.lower() for h in locale.bluesky_trusted_accounts}
-
-    def _post_is_relevant(self, text: str, author_handle: str) -> bool:
-        """Check if a post is about ICE enforcement in the locale area."""
-        handle_lower = author_handle.lower()
-        has_ice = bool(ICE_KEYWORDS_RE.search(text))
-        has_geo = bool(self._geo_re.search(text))
+        self._focused_accounts = frozenset(
+            sys.intern(h.lower()) for h in locale.bluesky_trusted_accounts
+        )
+
+    def _relevance_mask(self, texts: list[str], handles: list[str]) -> list[bool]:
+        """Check which posts are about ICE enforcement in the locale area.
+
+        All texts are scanned in one pass over a NUL-joined, lowercased
+        buffer; NUL is a non-word, non-space character so no keyword or
+        word boundary can straddle two posts.  Once a post is settled the
+        scan jumps straight to the next one.
+        """
+        n = len(texts)
+        if not n:
+            return []
 
-        # Locale-focused accounts only need ICE keyword
-        if handle_lower in self._focused_accounts:
-            return has_ice
+        # Lowercase per post first: lower() can change a string's length
+        lowered = [text.lower() for text in texts]
+        starts: list[int] = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+        blob = "\0".join(lowered)
+        blob_len = len(blob)
+
+        # Locale-focused accounts only need ICE keyword (bit 1); everyone
+        # else needs ICE and geo (bits 1 | 2).  Interned so the membership
+        # check hits on identity.
+        focused = self._focused_accounts
+        need = [
+            1 if sys.intern(h.lower()) in focused else 3
+            for h in handles
+        ]
+        hits = [0] * n
+
+        search = self._relevance_re.search
+        pos = 0
+        while pos < blob_len:
+            match = search(blob, pos)
+            if match is None:
+                break
+            i = bisect_right(starts, match.start()) - 1
+            hits[i] |= 1 if match.lastgroup == "ice" else 2
+            if hits[i] & need[i] == need[i]:
+                pos = starts[i + 1] if i + 1 < n else blob_len
+            else:
+                pos = match.end()
 
-        return has_ice and has_geo
+        return [hits[i] & need[i] == need[i] for i in range(n)]
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={"Accept": "application/json"}
-            )
-        return self._session
+        """Return the process-wide shared aiohttp session."""
+        return await get_session()
 
     async def _search_posts(self, query: str, limit: int = 25) -> list[dict]:
         """Search Bluesky for posts matching a query."""
@@ -95,9 +139,11 @@ class BlueskyCollector(BaseCollector):
         }
 
         try:
-            async with session.get(url, params=params, timeout=15) as resp:
+            async with self._bucket, session.get(
+                url, params=params, headers=_JSON_HEADERS, timeout=15
+            ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     return data.get("posts", [])
                 else:
                     logger.debug(
@@ -112,117 +158,125 @@ class BlueskyCollector(BaseCollector):
             logger.debug("[bluesky] Search error for '%s': %s", query, e)
             return []
 
-    async def _get_author_feed(self, handle: str, limit: int = 20) -> list[dict]:
-        """Get recent posts from a specific author."""
-        session = await self._ensure_session()
+    async def _resolve_did(self, handle: str) -> str | None:
+        """Resolve a handle to its DID, caching the result indefinitely."""
+        cached = self._did_cache.get(handle)
+        if cached:
+            return cached
 
-        # First resolve handle to DID
+        session = await self._ensure_session()
         resolve_url = f"{BSKY_PUBLIC_API}/xrpc/com.atproto.identity.resolveHandle"
         try:
-            async with session.get(
+            async with self._bucket, session.get(
                 resolve_url,
                 params={"handle": handle},
+                headers=_JSON_HEADERS,
                 timeout=10
             ) as resp:
                 if resp.status != 200:
                     logger.debug("[bluesky] Could not resolve handle: %s", handle)
-                    return []
-                data = await resp.json()
+                    return None
+                data = orjson.loads(await resp.read())
                 did = data.get("did")
-                if not did:
-                    return []
         except Exception as e:
             logger.debug("[bluesky] Handle resolution error for %s: %s", handle, e)
+            return None
+
+        if did:
+            self._did_cache[handle] = did
+        return did
+
+    async def _get_author_feed(self, handle: str, limit: int = 20) -> list[dict]:
+        """Get recent posts from a specific author."""
+        session = await self._ensure_session()
+
+        # Handles map to DIDs permanently, so only the first call resolves
+        did = await self._resolve_did(handle)
+        if not did:
             return []
 
-        # Get author's feed
         feed_url = f"{BSKY_PUBLIC_API}/xrpc/app.bsky.feed.getAuthorFeed"
-        params = {
-            "actor": did,
-            "limit": limit,
-            "filter": "posts_no_replies",
-        }
 
-        try:
-            async with session.get(feed_url, params=params, timeout=15) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return [item.get("post", {}) for item in data.get("feed", [])]
-                else:
+        for attempt in range(2):
+            params = {
+                "actor": did,
+                "limit": limit,
+                "filter": "posts_no_replies",
+            }
+            try:
+                async with self._bucket, session.get(
+                    feed_url, params=params, headers=_JSON_HEADERS, timeout=15
+                ) as resp:
+                    if resp.status == 200:
+                        data = orjson.loads(await resp.read())
+                        return [item.get("post", {}) for item in data.get("feed", [])]
+                    if resp.status in (400, 404) and attempt == 0:
+                        # Account may have migrated — drop the cached DID and retry
+                        self._did_cache.pop(handle, None)
+                        did = await self._resolve_did(handle)
+                        if did:
+                            continue
                     logger.debug(
                         "[bluesky] Feed fetch failed for %s: HTTP %d",
                         handle, resp.status
                     )
                     return []
-        except Exception as e:
-            logger.debug("[bluesky] Feed error for %s: %s", handle, e)
-            return []
+            except Exception as e:
+                logger.debug("[bluesky] Feed error for %s: %s", handle, e)
+                return []
+        return []
+
+    @staticmethod
+    def _post_timestamp(post: dict, now: datetime) -> datetime | None:
+        """Return the post's creation time, or None if it lacks a uri/text."""
+        record = post.get("record", {})
+        if not post.get("uri") or not record.get("text"):
+            return None
 
-    def _parse_post(self, post: dict, now: datetime) -> RawReport | None:
-        """Convert a Bluesky post to a RawReport."""
+        created_at_str = record.get("createdAt", "")
         try:
-            # Extract post data
-            uri = post.get("uri", "")
-            cid = post.get("cid", "")
-
-            record = post.get("record", {})
-            text = record.get("text", "")
-            created_at_str = record.get("createdAt", "")
-
-            author = post.get("author", {})
-            handle = author.get("handle", "")
-            display_name = author.get("displayName", handle)
-
-            if not uri or not text:
-                return None
-
-            # Parse timestamp
-            try:
-                # Bluesky uses ISO 8601 format
-                ts = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-            except Exception:
-                ts = now
-
-            # Check relevance
-            if not self._post_is_relevant(text, handle):
-                return None
-
-            # Build source ID and URL
-            # URI format: at://did:plc:xxx/app.bsky.feed.post/yyy
-            # Convert to web URL
-            parts = uri.split("/")
-            if len(parts) >= 5:
-                rkey = parts[-1]
-                web_url = f"https://bsky.app/profile/{handle}/post/{rkey}"
-            else:
-                web_url = f"https://bsky.app/profile/{handle}"
-
-            source_id = f"bluesky_{cid}" if cid else f"bluesky_{uri}"
-
-            if not self._is_new(source_id):
-                return None
-
-            return RawReport(
-                source_type="bluesky",
-                source_id=source_id,
-                source_url=web_url,
-                author=f"@{handle}",
-                text=text,
-                timestamp=ts,
-                collected_at=now,
-                raw_metadata={
-                    "uri": uri,
-                    "cid": cid,
-                    "handle": handle,
-                    "display_name": display_name,
-                    "like_count": post.get("likeCount", 0),
-                    "repost_count": post.get("repostCount", 0),
-                    "reply_count": post.get("replyCount", 0),
-                },
-            )
-        except Exception as e:
-            logger.debug("[bluesky] Error parsing post: %s", e)
-            return None
+            # Bluesky uses ISO 8601; 3.11+ parses the trailing "Z" natively
+            return datetime.fromisoformat(created_at_str) if created_at_str else now
+        except ValueError:
+            return now
+
+    def _build_report(
+        self, post: dict, source_id: str, ts: datetime, now: datetime
+    ) -> RawReport:
+        """Convert a relevant Bluesky post to a RawReport."""
+        uri = post.get("uri", "")
+        cid = post.get("cid", "")
+        author = post.get("author", {})
+        handle = author.get("handle", "")
+        display_name = author.get("displayName", handle)
+
+        # URI format: at://did:plc:xxx/app.bsky.feed.post/yyy
+        # Convert to web URL
+        parts = uri.split("/")
+        if len(parts) >= 5:
+            rkey = parts[-1]
+            web_url = f"https://bsky.app/profile/{handle}/post/{rkey}"
+        else:
+            web_url = f"https://bsky.app/profile/{handle}"
+
+        return RawReport(
+            source_type="bluesky",
+            source_id=source_id,
+            source_url=web_url,
+            author=f"@{handle}",
+            text=post["record"]["text"],
+            timestamp=ts,
+            collected_at=now,
+            raw_metadata={
+                "uri": uri,
+                "cid": cid,
+                "handle": handle,
+                "display_name": display_name,
+                "like_count": post.get("likeCount", 0),
+                "repost_count": post.get("repostCount", 0),
+                "reply_count": post.get("replyCount", 0),
+            },
+        )
 
     def get_poll_interval(self) -> int:
         """Poll every 2 minutes by default."""
@@ -232,6 +286,11 @@ class BlueskyCollector(BaseCollector):
         """Collect posts from Bluesky."""
         now = datetime.now(timezone.utc)
         reports: list[RawReport] = []
+        fetches = []
+
+        # searchPosts is sorted newest-first; author feeds are not (pinned
+        # posts and reposts can sit above fresher content)
+        newest_first: list[bool] = []
 
         # Rotate through search queries (1 per cycle to avoid rate limits)
         if self._search_queries:
@@ -239,38 +298,58 @@ class BlueskyCollector(BaseCollector):
             self._search_index += 1
 
             logger.debug("[bluesky] Searching: %s", query)
-            posts = await self._search_posts(query)
-
-            for post in posts:
-                report = self._parse_post(post, now)
-                if report:
-                    reports.append(report)
+            fetches.append(self._search_posts(query))
+            newest_first.append(True)
 
-            await asyncio.sleep(1)  # Rate limit courtesy
-
-        # Check monitored accounts (rotate through them)
+        # Check monitored accounts (rotate through them, 2 per cycle)
         if self._monitored_accounts:
-            # Check 2 accounts per cycle
             for i in range(2):
                 idx = (self._search_index + i) % len(self._monitored_accounts)
                 handle = self._monitored_accounts[idx]
 
                 logger.debug("[bluesky] Checking @%s", handle)
-                posts = await self._get_author_feed(handle)
-
-                for post in posts:
-                    report = self._parse_post(post, now)
-                    if report:
-                        reports.append(report)
-
-                await asyncio.sleep(1)
+                fetches.append(self._get_author_feed(handle))
+                newest_first.append(False)
+
+        # Search + feeds run concurrently: one round trip of wall time
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+
+        # Cheap filters first: stale and already-seen posts never reach
+        # the keyword scan or RawReport construction
+        max_age = self._max_age
+        candidates: list[tuple[dict, str, datetime]] = []
+        for posts, sorted_latest in zip(results, newest_first):
+            if isinstance(posts, BaseException):
+                logger.debug("[bluesky] Fetch error: %s", posts)
+                continue
+            for post in posts:
+                try:
+                    ts = self._post_timestamp(post, now)
+                    if ts is None:
+                        continue
+                    if now - ts > max_age:
+                        if sorted_latest:
+                            break  # everything after this is older still
+                        continue
+                except Exception as e:
+                    logger.debug("[bluesky] Error parsing post: %s", e)
+                    continue
+
+                cid = post.get("cid")
+                source_id = f"bluesky_{cid}" if cid else f"bluesky_{post['uri']}"
+                if self._is_new(source_id):
+                    candidates.append((post, source_id, ts))
+
+        # One keyword scan over every surviving post in the cycle
+        mask = self._relevance_mask(
+            [post["record"]["text"] for post, _, _ in candidates],
+            [post.get("author", {}).get("handle", "") for post, _, _ in candidates],
+        )
+        for (post, source_id, ts), relevant in zip(candidates, mask):
+            if relevant:
+                reports.append(self._build_report(post, source_id, ts, now))
 
         if reports:
             logger.info("[bluesky] Found %d relevant posts", len(reports))
 
         return reports
-
-    async def cleanup(self) -> None:
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
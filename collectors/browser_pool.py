@@ -12,7 +12,8 @@ Usage inside a collector::
 
     pool = BrowserPool.shared()
     ctx  = await pool.new_context(user_agent="...", viewport={...})
-    # ... use ctx.new_page(), etc.
+    async with pool.page_semaphore:
+        page = await ctx.new_page()        # ... use the page, then close it
     await pool.close_context(ctx)          # frees context resources
     # At shutdown the orchestrator calls  pool.shutdown()
 
@@ -42,6 +43,27 @@ _BROWSER_ARGS: list[str] = [
     "--disable-default-apps",
 ]
 
+# One Chromium process serves a few pages well; past that, per-page
+# latency degrades quickly on small machines.
+_MAX_OPEN_PAGES = 4
+
+# Resource types no collector consumes; see :func:`abort_heavy_resources`.
+BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset(
+    {"image", "media", "font", "stylesheet"}
+)
+
+
+async def abort_heavy_resources(route: Any) -> None:
+    """Route handler that aborts images, media, fonts and CSS.
+
+    Install with ``await ctx.route("**/*", abort_heavy_resources)`` (or
+    on a single page); documents, scripts and XHR/fetch pass through.
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class BrowserPool:
     """Manages a single shared Chromium instance.
@@ -49,7 +71,7 @@ class BrowserPool:
     * Thread-safe via an :class:`asyncio.Lock`.
     * The underlying browser is lazily launched on the first
       :meth:`new_context` call and re-launched automatically if it
-      disconnects.
+      disconnects.  Concurrent callers share one launch task.
     * Individual collectors call :meth:`close_context` to tear down
       their own context (freeing pages/cookies) without killing the
       shared process.
@@ -62,6 +84,11 @@ class BrowserPool:
         self._browser: Any | None = None
         self._lock = asyncio.Lock()
         self._context_count = 0
+        # Held by collectors around each page's lifetime, so scrapes
+        # running in parallel never have more pages open than this
+        self.page_semaphore = asyncio.Semaphore(_MAX_OPEN_PAGES)
+        # Pending launch shared by every caller that finds no browser
+        self._launching: asyncio.Task | None = None
 
     # ── singleton accessor ────────────────────────────────────────
     @classmethod
@@ -73,10 +100,26 @@ class BrowserPool:
 
     # ── internal helpers ──────────────────────────────────────────
     async def _ensure_browser(self) -> None:
-        """Launch Chromium if not already running (caller holds lock)."""
+        """Launch Chromium if not already running.
+
+        Concurrent callers await the same launch task instead of queueing
+        on a lock, so only one Chromium is ever started at a time.
+        """
         if self._browser is not None and self._browser.is_connected():
             return
 
+        if self._launching is None:
+            self._launching = asyncio.create_task(self._launch())
+        launching = self._launching
+        try:
+            # Shielded so one cancelled caller can't abort everyone's launch
+            await asyncio.shield(launching)
+        finally:
+            if launching.done() and self._launching is launching:
+                self._launching = None
+
+    async def _launch(self) -> None:
+        """Start Playwright and the shared Chromium process."""
         # Tear down stale handles first
         await self._teardown()
 
@@ -123,10 +166,12 @@ class BrowserPool:
         All *kwargs* are forwarded to ``browser.new_context()``
         (e.g. ``user_agent``, ``viewport``).
         """
+        await self._ensure_browser()
+        assert self._browser is not None
+        # CDP context creation is safe to run concurrently; only the
+        # bookkeeping below needs the lock
+        ctx = await self._browser.new_context(**kwargs)
         async with self._lock:
-            await self._ensure_browser()
-            assert self._browser is not None
-            ctx = await self._browser.new_context(**kwargs)
             self._context_count += 1
             logger.debug("[browser_pool] Context created (%d active)",
                          self._context_count)
@@ -147,6 +192,10 @@ class BrowserPool:
 
     async def shutdown(self) -> None:
         """Tear down the browser and Playwright.  Called once at exit."""
+        if self._launching is not None:
+            # Let an in-flight launch settle so its handles get torn down
+            await asyncio.gather(self._launching, return_exceptions=True)
+            self._launching = None
         async with self._lock:
             logger.info("[browser_pool] Shutting down shared browser …")
             await self._teardown()
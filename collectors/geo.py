@@ -0,0 +1,76 @@
+"""Vectorized locale-radius filter shared by the map-feed collectors.
+
+Collectors that receive batches of coordinates (iceout, stopice) build a
+:class:`LocaleCenters` once from ``locale.centers`` and test a whole
+batch per call::
+
+    from collectors.geo import LocaleCenters
+
+    centers = LocaleCenters(locale.centers)
+    mask = centers.within(lats, lons)   # NaN coordinates -> False
+
+The center-side terms are computed once at construction, and a cheap
+bounding-box test rejects far-away points before any trig runs.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+# Mean Earth radius used for haversine distances
+EARTH_RADIUS_KM = 6371.0
+
+
+class LocaleCenters:
+    """A fixed set of ``(lat, lon, radius_km)`` centers in array form."""
+
+    __slots__ = (
+        "lat", "lon", "radius_km",
+        "_lat_rad", "_lon_rad", "_cos_lat",
+        "_lat_window_deg", "_lon_window_deg",
+    )
+
+    def __init__(self, centers: Iterable[tuple[float, float, float]]) -> None:
+        arr = np.asarray(list(centers), dtype=np.float64).reshape(-1, 3)
+        self.lat = arr[:, 0]
+        self.lon = arr[:, 1]
+        self.radius_km = arr[:, 2]
+        self._lat_rad = np.radians(self.lat)
+        self._lon_rad = np.radians(self.lon)
+        self._cos_lat = np.cos(self._lat_rad)
+        # Bounding-box half-widths in degrees.  The longitude window uses
+        # the poleward edge of the box, where a degree is shortest, so the
+        # box never rejects a point the haversine would keep.
+        self._lat_window_deg = self.radius_km / 111.0
+        edge_lat = np.minimum(np.abs(self.lat) + self._lat_window_deg, 89.0)
+        self._lon_window_deg = self.radius_km / (
+            111.0 * np.cos(np.radians(edge_lat))
+        )
+
+    def within(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Boolean mask of points inside any center's radius.
+
+        *lats*/*lons* are 1-D degree arrays; NaN entries come back False.
+        """
+        # Cheap bounding-box reject first; trig only runs on the survivors
+        # (NaN coordinates compare False and drop out here too)
+        in_box = (
+            (np.abs(lats[:, None] - self.lat) <= self._lat_window_deg)
+            & (np.abs(lons[:, None] - self.lon) <= self._lon_window_deg)
+        ).any(axis=1)
+        mask = np.zeros(len(lats), dtype=bool)
+        idx = np.flatnonzero(in_box)
+        if idx.size:
+            lat_r = np.radians(lats[idx])[:, None]
+            dlat = lat_r - self._lat_rad
+            dlon = np.radians(lons[idx])[:, None] - self._lon_rad
+            a = (
+                np.sin(dlat / 2) ** 2
+                + np.cos(lat_r) * self._cos_lat * np.sin(dlon / 2) ** 2
+            )
+            a = np.minimum(a, 1.0)  # guard against rounding just above 1
+            dist = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+            mask[idx] = (dist <= self.radius_km).any(axis=1)
+        return mask
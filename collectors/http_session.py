@@ -0,0 +1,69 @@
+"""Shared aiohttp client session.
+
+Every HTTP collector draws from **one** ``aiohttp.ClientSession`` so that
+TLS handshakes, DNS lookups and keep-alive sockets are reused across
+collectors instead of each instance holding its own connection pool.
+
+Usage inside a collector::
+
+    from collectors.http_session import get_session
+
+    session = await get_session()
+    async with session.get(url, params=...) as resp:
+        ...
+    # At shutdown the orchestrator calls  close_session()
+
+Collectors must **not** close the returned session themselves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# 4 MB read buffer – the 64 KB default stalls on large JSON/HTML bodies
+_READ_BUFSIZE = 4 * 1024 * 1024
+
+_session: aiohttp.ClientSession | None = None
+_lock = asyncio.Lock()
+
+
+def _build_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=50,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        read_bufsize=_READ_BUFSIZE,
+        # connect bound keeps a dead host from eating the whole budget
+        timeout=aiohttp.ClientTimeout(total=15, connect=5),
+    )
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is not None and not _session.closed:
+        return _session
+    async with _lock:
+        if _session is None or _session.closed:
+            _session = _build_session()
+            logger.debug("[http_session] Shared client session created")
+        return _session
+
+
+async def close_session() -> None:
+    """Close the shared session.  Called once at exit."""
+    global _session
+    async with _lock:
+        if _session is not None and not _session.closed:
+            await _session.close()
+            logger.debug("[http_session] Shared client session closed")
+        _session = None
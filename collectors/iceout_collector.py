@@ -14,8 +14,8 @@ API details:
 Authentication:
     The API uses an Altcha proof-of-work CAPTCHA that requires browser-side
     JavaScript to solve. We use Playwright (headless Chromium) to load the
-    site, let the JS handle auth automatically, then intercept the API
-    response when the page fetches report data.
+    site, let the JS handle auth automatically, then request the API
+    with the browser context's auth cookies.
 
 We filter to Minneapolis/MN area reports client-side by checking
 location_description and coordinates.
@@ -24,13 +24,17 @@ location_description and coordinates.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-import msgpack
+import msgspec
+import numpy as np
+import orjson
 
 from collectors.base import BaseCollector
+from collectors.geo import LocaleCenters
 from storage.models import RawReport
 
 logger = logging.getLogger(__name__)
@@ -46,6 +50,9 @@ CATEGORY_LABELS = {
     3: "Other",
 }
 
+# Max distinct GeoJSON location strings memoized per collector
+_COORD_CACHE_SIZE = 1024
+
 # Status enum
 STATUS_LABELS = {
     0: "Not Confirmed",
@@ -53,40 +60,106 @@ STATUS_LABELS = {
 }
 
 
+class IceoutReport(msgspec.Struct, gc=False):
+    """One record from the report-feed API (unknown fields are ignored).
+
+    The feed is not schema-checked upstream, so every field is ``Any``:
+    one record with an odd type (``"1"`` for a status, a numeric
+    timestamp) must not fail validation for the whole array.  Consumers
+    check types where it matters.
+    """
+
+    id: Any = None
+    location: Any = None   # GeoJSON Point, sometimes as a string
+    location_description: Any = None
+    category_enum: Any = None
+    status: Any = None
+    incident_time: Any = None
+    created_at: Any = None
+    approved: Any = None
+    small_thumbnail: Any = None
+
+
+_FEED_TYPE = list[IceoutReport]
+_msgpack_decoder = msgspec.msgpack.Decoder(_FEED_TYPE)
+_json_decoder = msgspec.json.Decoder(_FEED_TYPE)
+# Fallback when some record is not a map at all: split the array into raw
+# items and convert each one on its own
+_msgpack_raw_decoder = msgspec.msgpack.Decoder(list[msgspec.Raw])
+_json_raw_decoder = msgspec.json.Decoder(list[msgspec.Raw])
+_msgpack_item_decoder = msgspec.msgpack.Decoder(IceoutReport)
+_json_item_decoder = msgspec.json.Decoder(IceoutReport)
+
 
+def _is_feed_response(response) -> bool:
+    """Match the page's own successful report-feed request."""
+    return "report-feed" in response.url and response.status == 200
 
-def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance in km between two lat/lon points."""
-    import math
-    R = 6371.0
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(math.radians(lat1))
-        * math.cos(math.radians(lat2))
-        * math.sin(dlon / 2) ** 2
-    )
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
+def _decode_feed(raw_bytes: bytes) -> list[IceoutReport] | None:
+    """Decode a report-feed body, picking the codec from its first byte.
+
+    The feed is normally MessagePack, but the server may answer with JSON;
+    a leading ``[`` or ``{`` (after optional whitespace) can only be JSON
+    here, since a MessagePack array never starts with those bytes.
+    """
+    body = raw_bytes.lstrip()
+    if not body:
+        return None
+    if body[:1] in (b"[", b"{"):
+        decoder, raw_decoder, item_decoder = (
+            _json_decoder, _json_raw_decoder, _json_item_decoder,
+        )
+    else:
+        decoder, raw_decoder, item_decoder = (
+            _msgpack_decoder, _msgpack_raw_decoder, _msgpack_item_decoder,
+        )
+    try:
+        return decoder.decode(body)
+    except msgspec.ValidationError as e:
+        # Usually one malformed record; drop just that one below
+        logger.debug("[iceout] Feed validation failed, decoding per record: %s", e)
+    except msgspec.DecodeError as e:
+        logger.debug("[iceout] Feed decode failed: %s", e)
+        return None
+
+    try:
+        items = raw_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        logger.debug("[iceout] Feed decode failed: %s", e)
+        return None
+    reports: list[IceoutReport] = []
+    for item in items:
+        try:
+            reports.append(item_decoder.decode(item))
+        except msgspec.DecodeError:
+            pass
+    skipped = len(items) - len(reports)
+    if skipped:
+        logger.debug("[iceout] Skipped %d malformed feed record(s)", skipped)
+    return reports
 
 
+def _enum_label(labels: dict[int, str], value: Any) -> str:
+    """Look up an enum label, tolerating off-type (even unhashable) values."""
+    try:
+        return labels.get(value, "Unknown")
+    except TypeError:
+        return "Unknown"
 
 
-def _extract_coords(report: dict) -> tuple[float | None, float | None]:
+def _extract_coords(report: IceoutReport) -> tuple[float | None, float | None]:
     """Extract (latitude, longitude) from GeoJSON location."""
-    loc_str = report.get("location")
-    if not loc_str:
+    loc = report.location
+    if not loc:
         return None, None
     try:
-        if isinstance(loc_str, str):
-            loc = json.loads(loc_str)
-        else:
-            loc = loc_str
+        if isinstance(loc, str):
+            loc = orjson.loads(loc)
         coords = loc.get("coordinates", [])
         if len(coords) >= 2:
             return coords[1], coords[0]  # GeoJSON is [lon, lat]
-    except (json.JSONDecodeError, TypeError, ValueError):
+    except (orjson.JSONDecodeError, AttributeError, TypeError, ValueError):
         pass
     return None, None
 
@@ -99,7 +172,7 @@ class IceoutCollector(BaseCollector):
     We use Playwright to run a headless Chromium instance that:
 
     1. Navigates to the site (JS handles auth automatically)
-    2. Intercepts the report-feed API response (MessagePack)
+    2. Requests the report-feed API with the context's cookies (MessagePack)
     3. Parses and filters reports to Minneapolis metro area
 
     The browser context persists between polling cycles to maintain the
@@ -114,42 +187,79 @@ class IceoutCollector(BaseCollector):
         self._context = None
         self._page = None
         self._authenticated = False
-        self._intercepted_data: list[bytes] = []
         self._polls_since_full_auth = 0  # Track polls since last full navigation
-        self._polls_since_context_recycle = 0  # Track for memory management
         # Locale-aware geo filter — supports multiple centers for multi-locale
         locale = self.config.locale
         self._centers = locale.centers
         self._location_keywords = {kw.lower() for kw in locale.geo_city_names}
-
-    def _is_locale_area(self, report: dict) -> bool:
-        """Check if an Iceout report is within any configured locale radius."""
-        loc_str = report.get("location")
-        if loc_str:
-            try:
-                if isinstance(loc_str, str):
-                    loc = json.loads(loc_str)
-                else:
-                    loc = loc_str
-                coords = loc.get("coordinates", [])
-                if len(coords) >= 2:
-                    lon, lat = coords[0], coords[1]
-                    for c_lat, c_lon, c_radius in self._centers:
-                        dist = _haversine_km(lat, lon, c_lat, c_lon)
-                        if dist <= c_radius:
-                            return True
-                    desc = report.get("location_description", "unknown")
-                    logger.debug(
-                        "[iceout] Rejecting report outside all locale centers: %s",
-                        desc[:50],
-                    )
-                    return False
-            except (json.JSONDecodeError, TypeError, ValueError):
-                pass
+        # Repeat addresses are common in the feed; skip re-parsing them
+        self._coord_cache: OrderedDict[str, tuple[float | None, float | None]] = OrderedDict()
+        # Center-side haversine terms never change, so compute them once
+        self._locale_centers = LocaleCenters(self._centers)
+
+    def _cached_coords(self, item: IceoutReport) -> tuple[float | None, float | None]:
+        """Return ``_extract_coords(item)``, memoized on string locations."""
+        loc = item.location
+        if not isinstance(loc, str):
+            return _extract_coords(item)
+        cache = self._coord_cache
+        coords = cache.get(loc)
+        if coords is not None:
+            cache.move_to_end(loc)
+            return coords
+        coords = _extract_coords(item)
+        cache[loc] = coords
+        if len(cache) > _COORD_CACHE_SIZE:
+            cache.popitem(last=False)
+        return coords
+
+    def _locale_mask(
+        self, data: list[IceoutReport]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flag which reports fall within any configured locale radius.
+
+        Returns ``(mask, lats, lons)``; the coordinate arrays (NaN where
+        missing) let the caller reuse each report's parsed location.
+
+        Reports outside every center's bounding box are rejected without
+        trig; distances for the rest are computed in one vectorized
+        haversine pass (reports x centers).  Reports without usable
+        coordinates fall back to a location-description match.
+        """
+        n = len(data)
+        lats = np.full(n, np.nan)
+        lons = np.full(n, np.nan)
+        for i, item in enumerate(data):
+            lat, lon = self._cached_coords(item)
+            if lat is not None and lon is not None:
+                # Convert both before storing either, so a bad longitude
+                # can't leave a half-filled row behind
+                try:
+                    lat_f = float(lat)
+                    lon_f = float(lon)
+                except (TypeError, ValueError):
+                    continue
+                lats[i] = lat_f
+                lons[i] = lon_f
+        has_coords = ~np.isnan(lats) & ~np.isnan(lons)
+
+        mask = self._locale_centers.within(lats, lons)
+
+        rejected = int(np.count_nonzero(has_coords & ~mask))
+        if rejected:
+            logger.debug(
+                "[iceout] Rejecting %d report(s) outside all locale centers",
+                rejected,
+            )
 
         # Fallback: check location description text
-        desc = (report.get("location_description") or "").lower()
-        return any(kw in desc for kw in self._location_keywords)
+        for i in np.flatnonzero(~has_coords):
+            desc = data[i].location_description
+            if isinstance(desc, str):
+                desc = desc.lower()
+                mask[i] = any(kw in desc for kw in self._location_keywords)
+
+        return mask, lats, lons
 
     async def _ensure_browser(self) -> bool:
         """Obtain a browser context + page from the shared pool."""
@@ -167,7 +277,7 @@ class IceoutCollector(BaseCollector):
                 await self._close_browser()
 
         try:
-            from collectors.browser_pool import BrowserPool
+            from collectors.browser_pool import BrowserPool, abort_heavy_resources
 
             self._pool = BrowserPool.shared()
 
@@ -180,11 +290,10 @@ class IceoutCollector(BaseCollector):
                 ),
                 viewport={"width": 1280, "height": 720},
             )
+            # Skip map tiles, images, fonts and CSS on every (re-)navigation
+            await self._context.route("**/*", abort_heavy_resources)
             self._page = await self._context.new_page()
 
-            # Set up response interception for the report-feed API
-            self._page.on("response", self._on_response)
-
             logger.info("[iceout] Browser context ready (shared pool)")
             return True
 
@@ -197,36 +306,42 @@ class IceoutCollector(BaseCollector):
             await self._close_browser()
             return False
 
-    async def _on_response(self, response) -> None:
-        """Intercept API responses containing report data."""
-        if "report-feed" in response.url and response.status == 200:
-            try:
-                body = await response.body()
-                # Only keep the most recent response to prevent memory leak
-                self._intercepted_data = [body]
-                logger.debug(
-                    "[iceout] Intercepted report-feed response (%d bytes)",
-                    len(body),
-                )
-            except Exception as e:
-                logger.debug("[iceout] Failed to read response body: %s", e)
+    async def _fetch_feed(self, since_str: str) -> bytes | None:
+        """Fetch the report feed using the context's auth cookies.
 
-    async def _navigate_and_fetch(self) -> bytes | None:
-        """Navigate to iceout.org and capture the API response.
+        Tries Playwright's APIRequestContext first (no page-side JS or
+        response listeners involved) and falls back to an in-page fetch.
+        """
+        url = f"{ICEOUT_API_URL}?&since={since_str}"
+        try:
+            resp = await self._page.request.get(url, timeout=30000)
+            if resp.ok:
+                return await resp.body()
+            logger.debug("[iceout] API request returned HTTP %d", resp.status)
+        except Exception as e:
+            logger.debug("[iceout] API request failed: %s", e)
+
+        js_code = f"""
+        async () => {{
+            const resp = await fetch('{url}', {{ credentials: 'include' }});
+            if (!resp.ok) return null;
+            const buf = await resp.arrayBuffer();
+            return Array.from(new Uint8Array(buf));
+        }}
+        """
+        result = await asyncio.wait_for(self._page.evaluate(js_code), timeout=30.0)
+        return bytes(result) if result is not None else None
 
-        The site's JavaScript automatically:
-        1. Performs Altcha proof-of-work auth
-        2. Fetches the report feed
-        3. Renders the map
+    async def _navigate_and_fetch(self, now: datetime) -> bytes | None:
+        """Fetch the report feed, navigating to iceout.org for auth if needed.
 
-        We intercept step 2's response.
+        The site's JavaScript automatically performs the Altcha
+        proof-of-work auth on page load; once the context holds the
+        auth cookies we request the feed directly.
         """
         if self._page is None:
             return None
 
-        self._intercepted_data.clear()
-
-        now = datetime.now(timezone.utc)
         since = now - timedelta(hours=3)
         since_str = since.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
@@ -237,105 +352,48 @@ class IceoutCollector(BaseCollector):
             self._authenticated = False
             self._polls_since_full_auth = 0
 
-        # If already authenticated, fetch the API directly via the page context
+        # If already authenticated, fetch the API directly
         if self._authenticated:
             logger.info("[iceout] Using cached auth, fetching API directly")
             try:
-                # Use page.evaluate to make a fetch from the authenticated context
-                # Add timeout to prevent indefinite hangs
-                js_code = f"""
-                async () => {{
-                    const resp = await fetch(
-                        '{ICEOUT_API_URL}?&since={since_str}',
-                        {{ credentials: 'include' }}
-                    );
-                    if (!resp.ok) return null;
-                    const buf = await resp.arrayBuffer();
-                    return Array.from(new Uint8Array(buf));
-                }}
-                """
-                result = await asyncio.wait_for(
-                    self._page.evaluate(js_code),
-                    timeout=30.0
-                )
+                result = await self._fetch_feed(since_str)
                 if result is not None:
                     logger.info("[iceout] Direct API fetch successful (%d bytes)", len(result))
-                    return bytes(result)
+                    return result
 
                 # Fetch failed (maybe session expired), fall through to full nav
                 logger.warning(
-                    "[iceout] In-page fetch returned None (session may have expired), re-navigating..."
+                    "[iceout] Direct fetch returned nothing (session may have expired), re-navigating..."
                 )
-                self._authenticated = False
             except asyncio.TimeoutError:
-                logger.warning("[iceout] In-page fetch timed out after 30s, re-navigating...")
-                self._authenticated = False
+                logger.warning("[iceout] Direct fetch timed out after 30s, re-navigating...")
             except Exception as e:
-                logger.warning("[iceout] In-page fetch error: %s", e)
-                self._authenticated = False
+                logger.warning("[iceout] Direct fetch error: %s", e)
+            self._authenticated = False
 
-        # Full navigation — let the site's JS handle auth
+        # Full navigation — let the site's JS handle auth.  The page
+        # requests the feed itself once Altcha completes, so resolve on
+        # that response instead of sleeping a fixed interval.
         logger.info("[iceout] Navigating to %s for auth", ICEOUT_SITE_URL)
         try:
-            await self._page.goto(
-                ICEOUT_SITE_URL,
-                wait_until="networkidle",
-                timeout=60000,
-            )
-            logger.info("[iceout] Navigation complete, checking for intercepted data")
-
-            # Wait longer for Altcha proof-of-work + API calls to complete
-            # (increased from 3s to handle slower auth cycles)
-            logger.info("[iceout] Waiting 10 seconds for auth + API completion...")
-            await asyncio.sleep(10)
-
-            # Check if we intercepted the report-feed response
-            if self._intercepted_data:
-                self._authenticated = True
-                logger.info(
-                    "[iceout] Intercepted %d API response(s) during navigation, using most recent (%d bytes)",
-                    len(self._intercepted_data),
-                    len(self._intercepted_data[-1])
+            async with self._page.expect_response(
+                _is_feed_response, timeout=30000
+            ) as response_info:
+                # No need to wait for the map to go idle: the feed
+                # response above signals completion
+                await self._page.goto(
+                    ICEOUT_SITE_URL,
+                    wait_until="domcontentloaded",
+                    timeout=30000,
                 )
-                return self._intercepted_data[-1]  # Use most recent
-
-            # The initial page load may fetch all reports without a since param.
-            # Try fetching with our specific time filter now that we're authed.
-            try:
-                js_code = f"""
-                async () => {{
-                    const resp = await fetch(
-                        '{ICEOUT_API_URL}?&since={since_str}',
-                        {{ credentials: 'include' }}
-                    );
-                    if (!resp.ok) return null;
-                    const buf = await resp.arrayBuffer();
-                    return Array.from(new Uint8Array(buf));
-                }}
-                """
-                result = await asyncio.wait_for(
-                    self._page.evaluate(js_code),
-                    timeout=30.0
-                )
-                if result is not None:
-                    self._authenticated = True
-                    logger.info("[iceout] Post-nav fetch successful (%d bytes)", len(result))
-                    return bytes(result)
-            except asyncio.TimeoutError:
-                logger.warning("[iceout] Post-nav fetch timed out after 30s")
-            except Exception as e:
-                logger.warning("[iceout] Post-nav fetch error: %s", e)
-
-            # Last resort: check intercepted data from initial page load
-            if self._intercepted_data:
-                self._authenticated = True
-                return self._intercepted_data[-1]
-
-            logger.warning("[iceout] No report data captured after navigation")
-            return None
+            response = await response_info.value
+            result = await response.body()
+            self._authenticated = True
+            logger.info("[iceout] Captured report feed during navigation (%d bytes)", len(result))
+            return result
 
         except Exception as e:
-            logger.warning("[iceout] Navigation failed: %s", e)
+            logger.warning("[iceout] No report data captured after navigation: %s", e)
             return None
 
     async def _close_browser(self) -> None:
@@ -372,13 +430,6 @@ class IceoutCollector(BaseCollector):
 
     async def _do_collect(self) -> list[RawReport]:
         """Internal collection logic with timeout wrapper."""
-        # Recycle context every 20 polls (~40 min at 2-min intervals) to prevent memory growth
-        self._polls_since_context_recycle += 1
-        if self._polls_since_context_recycle >= 20:
-            logger.info("[iceout] Recycling context to free memory (20 polls reached)")
-            await self._close_browser()
-            self._polls_since_context_recycle = 0
-
         if not await self._ensure_browser():
             logger.warning("[iceout] Browser not available, skipping cycle")
             return []
@@ -386,7 +437,7 @@ class IceoutCollector(BaseCollector):
         now = datetime.now(timezone.utc)
 
         try:
-            raw_bytes = await self._navigate_and_fetch()
+            raw_bytes = await self._navigate_and_fetch(now)
             if raw_bytes is None:
                 logger.warning(
                     "[iceout] No data received from API (auth: %s, polls_since_auth: %d)",
@@ -395,81 +446,76 @@ class IceoutCollector(BaseCollector):
                 )
                 return []
             logger.info("[iceout] Received %d bytes from API (auth: %s)", len(raw_bytes), self._authenticated)
-
-            data = msgpack.unpackb(raw_bytes, raw=False)
-
         except Exception as e:
-            logger.warning("[iceout] Failed to fetch/parse reports: %s", e)
+            logger.warning("[iceout] Failed to fetch reports: %s", e)
             # Reset browser on unexpected errors
             await self._close_browser()
             return []
 
-        if not isinstance(data, list):
-            # Might be JSON instead of msgpack if server sent a different format
-            if isinstance(raw_bytes, bytes):
-                try:
-                    data = json.loads(raw_bytes)
-                except (json.JSONDecodeError, ValueError):
-                    pass
-            if not isinstance(data, list):
-                logger.warning(
-                    "[iceout] Unexpected response type: %s", type(data)
-                )
-                return []
+        data = _decode_feed(raw_bytes)
+        if data is None:
+            logger.warning(
+                "[iceout] Could not decode report feed (%d bytes)", len(raw_bytes)
+            )
+            return []
 
         reports: list[RawReport] = []
         mpls_count = 0
         skipped_seen = 0
         skipped_stale = 0
 
-        for item in data:
-            # Filter to locale area
-            if not self._is_locale_area(item):
-                continue
+        # Loop-invariant lookups bound once (3.11+ fromisoformat takes "Z")
+        fromiso = datetime.fromisoformat
+        isnan = np.isnan
+        is_new = self._is_new
+        # Enforce 6-hour freshness (trusted source gets longer window)
+        cutoff = now - self._max_age
+
+        in_area, lats, lons = self._locale_mask(data)
+        for i in np.flatnonzero(in_area):
+            # Only locale-area reports reach this loop
+            item = data[i]
 
             mpls_count += 1
-            report_id = item.get("id")
+            report_id = item.id
             if report_id is None:
                 continue
 
             source_id = f"iceout_{report_id}"
-            if not self._is_new(source_id):
+            if not is_new(source_id):
                 skipped_seen += 1
                 continue
 
             # Parse timestamps
-            incident_time_str = item.get("incident_time")
-            created_at_str = item.get("created_at")
+            incident_time_str = item.incident_time
+            created_at_str = item.created_at
 
             if incident_time_str:
                 try:
-                    incident_time = datetime.fromisoformat(
-                        incident_time_str.replace("Z", "+00:00")
-                    )
-                except ValueError:
+                    incident_time = fromiso(incident_time_str)
+                except (TypeError, ValueError):
                     incident_time = now
             else:
                 incident_time = now
 
-            # Enforce 6-hour freshness (trusted source gets longer window)
-            age = now - incident_time
-            if age > timedelta(hours=6):
+            if incident_time < cutoff:
+                skipped_stale += 1
                 continue
 
             if created_at_str:
                 try:
-                    created_at = datetime.fromisoformat(
-                        created_at_str.replace("Z", "+00:00")
-                    )
-                except ValueError:
+                    created_at = fromiso(created_at_str)
+                except (TypeError, ValueError):
                     created_at = now
             else:
                 created_at = now
 
-            lat, lon = _extract_coords(item)
-            category = CATEGORY_LABELS.get(item.get("category_enum"), "Unknown")
-            status = STATUS_LABELS.get(item.get("status"), "Unknown")
-            location_desc = item.get("location_description", "Unknown location")
+            # Coordinates were parsed once by _locale_mask
+            lat = None if isnan(lats[i]) else float(lats[i])
+            lon = None if isnan(lons[i]) else float(lons[i])
+            category = _enum_label(CATEGORY_LABELS, item.category_enum)
+            status = _enum_label(STATUS_LABELS, item.status)
+            location_desc = item.location_description or "Unknown location"
 
             # Build readable text from structured data
             text = (
@@ -493,31 +539,33 @@ class IceoutCollector(BaseCollector):
                 raw_metadata={
                     "iceout_id": report_id,
                     "category": category,
-                    "category_enum": item.get("category_enum"),
+                    "category_enum": item.category_enum,
                     "status": status,
-                    "status_enum": item.get("status"),
-                    "approved": item.get("approved"),
+                    "status_enum": item.status,
+                    "approved": item.approved,
                     "location_description": location_desc,
                     "latitude": lat,
                     "longitude": lon,
-                    "thumbnail": item.get("small_thumbnail"),
+                    "thumbnail": item.small_thumbnail,
                 },
             ))
 
         if reports:
             logger.info(
-                "[iceout] Found %d NEW locale-area reports (of %d total, %d in area, %d already seen)",
+                "[iceout] Found %d NEW locale-area reports (of %d total, %d in area, %d already seen, %d stale)",
                 len(reports),
                 len(data),
                 mpls_count,
                 skipped_seen,
+                skipped_stale,
             )
         else:
             logger.info(
-                "[iceout] No new reports (%d total, %d in locale area, %d already seen)",
+                "[iceout] No new reports (%d total, %d in locale area, %d already seen, %d stale)",
                 len(data),
                 mpls_count,
                 skipped_seen,
+                skipped_stale,
             )
 
         return reports
@@ -22,11 +22,14 @@ Use at your own discretion.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, NamedTuple
+
+import orjson
 
 from collectors.base import BaseCollector
 from storage.models import RawReport
@@ -53,6 +56,127 @@ ICE_KEYWORDS_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Cheap substring prefilter: every ICE_KEYWORDS_RE alternative contains at
+# least one of these, so a caption with none of them can't match.  Keep in
+# sync with the regex; multi-word phrases use a single word because the
+# regex allows any whitespace between words.
+_ICE_TRIGGERS = (
+    "ice", "immigration", "deport", "federal", "ero", "detention",
+    "undocumented", "rapid", "alert", "rights", "unmarked",
+)
+
+# Posts shown on a profile grid before scrolling
+_PROFILE_GRID_SIZE = 12
+
+# Decoded API payloads waiting for the parser; a full queue makes the
+# response handlers wait instead of piling up JSON in memory
+_API_QUEUE_SIZE = 16
+
+# In-page __NEXT_DATA__ extraction.  Returns {posts: [...]} with flat post
+# objects when the timeline media edges are found, {raw: "<script text>"}
+# for unfamiliar layouts (a single string is far cheaper to ship over CDP
+# than the re-serialized object tree), or null when there is no tag.
+_NEXT_DATA_JS = """
+(limit) => {
+    const script = document.querySelector('script#__NEXT_DATA__');
+    if (!script) return null;
+    const data = JSON.parse(script.textContent);
+    const queue = [[data, 0]];
+    while (queue.length) {
+        const [obj, depth] = queue.shift();
+        if (depth > 10 || obj === null || typeof obj !== 'object') continue;
+        const media = obj.edge_owner_to_timeline_media;
+        if (media && Array.isArray(media.edges)) {
+            const posts = [];
+            for (const edge of media.edges.slice(0, limit)) {
+                const node = (edge && edge.node) || edge || {};
+                const id = node.id || node.pk;
+                if (!id) continue;
+                const cap = node.edge_media_to_caption?.edges?.[0]?.node?.text
+                    ?? (typeof node.caption === 'string' ? node.caption : node.caption?.text)
+                    ?? '';
+                if (!cap && !node.shortcode) continue;
+                posts.push({
+                    id: String(id),
+                    shortcode: node.shortcode ?? null,
+                    text: cap,
+                    timestamp: node.taken_at_timestamp ?? node.taken_at ?? null,
+                    like_count: node.edge_liked_by?.count || node.like_count || 0,
+                    comment_count: node.edge_media_to_comment?.count || node.comment_count || 0,
+                });
+            }
+            return { posts };
+        }
+        for (const v of Object.values(obj)) {
+            if (v !== null && typeof v === 'object') queue.push([v, depth + 1]);
+        }
+    }
+    return { raw: script.textContent };
+}
+"""
+
+# Detect the "not found", private-account and login walls from the page's
+# visible text, returning three booleans instead of the whole rendered HTML
+_WALL_FLAGS_JS = """
+() => {
+    const t = (document.body && document.body.innerText) || '';
+    return {
+        missing: t.includes("Sorry, this page isn't available"),
+        private: t.includes('This account is private')
+            || t.includes('This Account is Private'),
+        login: t.includes('Log in') && /to see photos/i.test(t),
+    };
+}
+"""
+
+# Shortcode from a post permalink like /p/ABC123/.  Patterns used inside
+# loops are compiled here at module scope, never inline with re.search().
+_POST_SHORTCODE_RE = re.compile(r"/p/([A-Za-z0-9_-]+)/")
+
+# Shared read-only default for chained .get() lookups, so missing nested
+# objects don't allocate a throwaway dict per lookup.  Never mutate it.
+_EMPTY: dict = {}
+
+
+class _ParsedPost(NamedTuple):
+    """One post extracted from any of the profile page's data sources."""
+
+    id: str
+    shortcode: str | None
+    text: str
+    timestamp: int | str | None
+    username: str
+    like_count: int = 0
+    comment_count: int = 0
+
+
+def _post_from_node(
+    node: dict, post_id: str, shortcode: str | None, caption: str, username: str
+) -> _ParsedPost:
+    """Build a post from a GraphQL media node in either layout."""
+    return _ParsedPost(
+        id=str(post_id),
+        shortcode=shortcode,
+        text=caption,
+        timestamp=node.get("taken_at_timestamp") or node.get("taken_at"),
+        username=username,
+        like_count=node.get("edge_liked_by", _EMPTY).get("count", 0)
+                   or node.get("like_count", 0),
+        comment_count=node.get("edge_media_to_comment", _EMPTY).get("count", 0)
+                      or node.get("comment_count", 0),
+    )
+
+
+def _extract_caption(node: dict) -> str:
+    """Return a post's caption from either Instagram node layout."""
+    edges = node.get("edge_media_to_caption", _EMPTY).get("edges")
+    if edges:
+        return edges[0].get("node", _EMPTY).get("text", "")
+    cap = node.get("caption")
+    if isinstance(cap, dict):
+        return cap.get("text", "")
+    return cap if isinstance(cap, str) else ""
+
 
 def _parse_instagram_timestamp(timestamp: int | str | None) -> datetime:
     """Parse Instagram timestamp (Unix epoch) to datetime."""
@@ -75,10 +199,19 @@ class InstagramCollector(BaseCollector):
 
     name = "instagram"
 
+    # Browser identity for the scraping context
+    _UA = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+    _VIEWPORT = {"width": 1280, "height": 900}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._pool = None           # set in _ensure_browser
         self._context = None
+        self._modal_dismissed = False  # per context; reset on close
         self._accounts_per_cycle = 2  # Check 2 accounts per cycle
         self._cycle_count = 0
         # Build locale-aware data
@@ -89,6 +222,10 @@ class InstagramCollector(BaseCollector):
 
     def _post_is_relevant(self, text: str, username: str) -> bool:
         """Check if a post is about ICE enforcement in the locale area."""
+        text_lower = text.lower()
+        if not any(t in text_lower for t in _ICE_TRIGGERS):
+            return False
+
         username_lower = username.lower()
         has_ice = bool(ICE_KEYWORDS_RE.search(text))
         has_geo = bool(self._geo_re.search(text))
@@ -105,17 +242,14 @@ class InstagramCollector(BaseCollector):
             return True
 
         try:
-            from collectors.browser_pool import BrowserPool
+            from collectors.browser_pool import BrowserPool, abort_heavy_resources
 
             self._pool = BrowserPool.shared()
             self._context = await self._pool.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1280, "height": 900},
+                user_agent=self._UA, viewport=self._VIEWPORT
             )
+            # Thumbnails, video, fonts and CSS are never read by the scraper
+            await self._context.route("**/*", abort_heavy_resources)
 
             logger.info("[instagram] Browser context ready (shared pool)")
             return True
@@ -125,8 +259,8 @@ class InstagramCollector(BaseCollector):
             await self._close_browser()
             return False
 
-    async def _scrape_profile(self, username: str) -> list[dict]:
-        """Load a public Instagram profile and extract recent posts.
+    async def _scrape_profile(self, username: str) -> list[_ParsedPost]:
+        """Load a public Instagram profile and extract new, relevant posts.
 
         Instagram embeds post data in a __NEXT_DATA__ script tag or
         through GraphQL API calls. We try both approaches.
@@ -135,155 +269,247 @@ class InstagramCollector(BaseCollector):
             return []
 
         posts = []
-        api_data: list[dict] = []
+        api_posts: list[_ParsedPost] = []
+        api_seen = asyncio.Event()
+        # Payloads are parsed as they arrive and then dropped, so at most a
+        # queue's worth of decoded JSON is alive at any moment
+        api_queue: asyncio.Queue = asyncio.Queue(maxsize=_API_QUEUE_SIZE)
+        accepting = True
+
+        # Every post with an ID passes through is_new exactly once, so
+        # the count says whether any structured data was found at all
+        candidates = 0
+
+        def is_new(source_id: str) -> bool:
+            nonlocal candidates
+            candidates += 1
+            return self._is_new(source_id)
 
         async def on_response(response) -> None:
             """Intercept GraphQL responses containing post data."""
+            # Cheap synchronous filters first: only API calls can carry posts
+            if not accepting or response.status != 200:
+                return
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
             url = response.url
-            if response.status == 200:
-                # Instagram GraphQL endpoints
-                if "graphql" in url or "api/v1/users" in url:
-                    try:
-                        data = await response.json()
-                        api_data.append(data)
-                    except Exception:
-                        pass
-
-        page = await self._context.new_page()
-        page.on("response", on_response)
+            # Instagram GraphQL endpoints
+            if "graphql" in url or "api/v1/users" in url:
+                try:
+                    data = orjson.loads(await response.body())
+                except Exception:
+                    return
+                # Backpressure: wait for the parser when the queue is full
+                await api_queue.put(data)
+                api_seen.set()
+
+        # The pool caps open pages across all collectors sharing Chromium
+        async with self._pool.page_semaphore:
+            page = await self._context.new_page()
+            page.on("response", on_response)
+            consumer = asyncio.create_task(
+                self._drain_api_queue(api_queue, username, is_new, api_posts)
+            )
 
-        try:
-            profile_url = f"https://www.instagram.com/{username}/"
-            logger.debug("[instagram] Loading profile: %s", profile_url)
+            try:
+                profile_url = f"https://www.instagram.com/{username}/"
+                logger.debug("[instagram] Loading profile: %s", profile_url)
 
-            await page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(3)  # Wait for dynamic content
+                await page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
+                # Wait for dynamic content: whichever post source shows up first
+                await self._wait_for_post_data(page, api_seen)
 
-            # Try to dismiss login modal if it appears
-            try:
-                # Look for "Not now" or close button on login modal
-                not_now_btn = page.locator('text="Not now"')
-                if await not_now_btn.is_visible(timeout=2000):
-                    await not_now_btn.click()
-                    await asyncio.sleep(1)
-            except Exception:
-                pass
+                # The context keeps the modal's dismissal state, so once it
+                # has been closed later pages don't show it again
+                if not self._modal_dismissed:
+                    self._modal_dismissed = await self._dismiss_login_modal(page)
 
-            try:
-                # Also try clicking outside the modal or pressing Escape
-                close_btn = page.locator('[aria-label="Close"]')
-                if await close_btn.is_visible(timeout=1000):
-                    await close_btn.click()
-                    await asyncio.sleep(1)
-            except Exception:
-                pass
+                # Check if we hit a login wall or the profile doesn't exist
+                flags = await page.evaluate(_WALL_FLAGS_JS)
 
-            try:
-                # Press Escape to dismiss any modal
-                await page.keyboard.press("Escape")
-                await asyncio.sleep(0.5)
-            except Exception:
-                pass
+                if flags["missing"]:
+                    logger.warning("[instagram] @%s profile not found", username)
+                    return []
 
-            # Check if we hit a login wall or the profile doesn't exist
-            page_content = await page.content()
+                # Check for private account
+                if flags["private"]:
+                    logger.warning("[instagram] @%s is a private account", username)
+                    return []
 
-            if "Sorry, this page isn't available" in page_content:
-                logger.warning("[instagram] @%s profile not found", username)
-                return []
+                if flags["login"]:
+                    logger.warning("[instagram] @%s requires login to view", username)
+                    return []
 
-            # Check for private account
-            if "This account is private" in page_content or "This Account is Private" in page_content:
-                logger.warning("[instagram] @%s is a private account", username)
-                return []
+                # Extract posts from the __NEXT_DATA__ script tag inside the page,
+                # so only a handful of flat post objects cross the CDP bridge
+                try:
+                    next_data = await page.evaluate(_NEXT_DATA_JS, _PROFILE_GRID_SIZE)
+                    if next_data and next_data.get("posts") is not None:
+                        for raw in next_data["posts"]:
+                            post = _ParsedPost(username=username, **raw)
+                            if self._keep_post(post, username, is_new):
+                                posts.append(post)
+                    elif next_data and next_data.get("raw"):
+                        # Unfamiliar layout: fall back to the generic Python walk
+                        posts.extend(self._parse_next_data(
+                            orjson.loads(next_data["raw"]), username, is_new
+                        ))
+                except Exception as e:
+                    logger.debug("[instagram] Could not parse __NEXT_DATA__: %s", e)
+
+                # Also take the posts from intercepted API responses: stop
+                # accepting payloads and let the consumer finish the queue
+                accepting = False
+                await api_queue.join()
+                consumer.cancel()
+                posts.extend(api_posts)
+
+                # Try to extract from page HTML as fallback
+                if not candidates:
+                    for post in await self._extract_from_html(page, username):
+                        if self._keep_post(post, username, is_new):
+                            posts.append(post)
+
+                # is_new() already dropped repeats across the sources above
+                if posts:
+                    logger.debug(
+                        "[instagram] @%s: found %d new posts", username, len(posts)
+                    )
 
-            if "Log in" in page_content and "to see photos" in page_content.lower():
-                logger.warning("[instagram] @%s requires login to view", username)
-                return []
+                return posts
 
-            # Try to extract posts from __NEXT_DATA__ script tag
-            try:
-                next_data = await page.evaluate("""
-                    () => {
-                        const script = document.querySelector('script#__NEXT_DATA__');
-                        if (script) {
-                            return JSON.parse(script.textContent);
-                        }
-                        return null;
-                    }
-                """)
-                if next_data:
-                    posts.extend(self._parse_next_data(next_data, username))
             except Exception as e:
-                logger.debug("[instagram] Could not parse __NEXT_DATA__: %s", e)
-
-            # Also try to extract from intercepted API responses
-            for data in api_data:
-                posts.extend(self._parse_api_response(data, username))
-
-            # Try to extract from page HTML as fallback
-            if not posts:
-                posts.extend(await self._extract_from_html(page, username))
-
-            # Deduplicate by post ID
-            seen_ids = set()
-            unique_posts = []
-            for post in posts:
-                post_id = post.get("id")
-                if post_id and post_id not in seen_ids:
-                    seen_ids.add(post_id)
-                    unique_posts.append(post)
-
-            if unique_posts:
-                logger.debug(
-                    "[instagram] @%s: found %d posts", username, len(unique_posts)
-                )
+                logger.debug("[instagram] Error scraping @%s: %s", username, e)
+                return []
+            finally:
+                consumer.cancel()
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def _drain_api_queue(
+        self,
+        queue: asyncio.Queue,
+        username: str,
+        is_new: Callable[[str], bool],
+        out: list[_ParsedPost],
+    ) -> None:
+        """Parse API payloads from *queue* into *out* until cancelled."""
+        while True:
+            data = await queue.get()
+            try:
+                out.extend(self._parse_api_response(data, username, is_new))
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    async def _dismiss_login_modal(page) -> bool:
+        """Try to close the login modal; return True if one was dismissed."""
+        dismissed = False
+        try:
+            # Look for "Not now" or close button on login modal
+            not_now_btn = page.locator('text="Not now"')
+            if await not_now_btn.is_visible():
+                await not_now_btn.click()
+                await not_now_btn.wait_for(state="hidden", timeout=1500)
+                dismissed = True
+        except Exception:
+            pass
+
+        try:
+            # Also try clicking outside the modal or pressing Escape
+            close_btn = page.locator('[aria-label="Close"]')
+            if await close_btn.is_visible():
+                await close_btn.click()
+                await close_btn.wait_for(state="hidden", timeout=1500)
+                dismissed = True
+        except Exception:
+            pass
 
-            return unique_posts
+        try:
+            # Press Escape to dismiss any modal
+            await page.keyboard.press("Escape")
+        except Exception:
+            pass
+
+        return dismissed
+
+    def _keep_post(
+        self, post: _ParsedPost, username: str, is_new: Callable[[str], bool]
+    ) -> bool:
+        """Dedupe and relevance-check a post extracted in the page."""
+        if not is_new(f"instagram_{post.id}"):
+            return False
+        # Pass through if no text - we got the link
+        return not post.text or self._post_is_relevant(post.text, username)
 
-        except Exception as e:
-            logger.debug("[instagram] Error scraping @%s: %s", username, e)
-            return []
+    @staticmethod
+    async def _wait_for_post_data(
+        page, api_seen: asyncio.Event, timeout: float = 6.0
+    ) -> None:
+        """Return once __NEXT_DATA__ is in the DOM or an API payload landed.
+
+        Gives up quietly after *timeout* seconds; the caller still tries
+        every extraction path.
+        """
+        waiters = [
+            asyncio.ensure_future(page.wait_for_selector(
+                "script#__NEXT_DATA__", state="attached", timeout=timeout * 1000
+            )),
+            asyncio.ensure_future(api_seen.wait()),
+        ]
+        try:
+            await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
         finally:
-            try:
-                await page.close()
-            except Exception:
-                pass
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
 
-    def _parse_next_data(self, data: dict, username: str) -> list[dict]:
-        """Extract posts from Instagram's __NEXT_DATA__ JSON."""
+    def _parse_next_data(
+        self, data: dict, username: str, is_new: Callable[[str], bool]
+    ) -> list[_ParsedPost]:
+        """Extract new, relevant posts from Instagram's __NEXT_DATA__ JSON.
+
+        Already-seen posts are skipped before their caption is touched.
+        """
         posts = []
         try:
             # Navigate the nested structure to find posts
-            # Structure varies, so we try multiple paths
-
-            def find_edges(obj, depth=0):
-                """Recursively find edge arrays containing posts."""
+            # Structure varies, so we search for edge arrays anywhere.
+            # Breadth-first so shallow timeline edges are found before the
+            # large side-trees; collected edge lists are not descended into.
+            # The walk ends once the timeline media edges are in hand --
+            # other edge lists (related profiles, mutual followers) don't
+            # count towards that.
+            edges: list = []
+            queue = deque([(data, 0)])
+            while queue:
+                obj, depth = queue.popleft()
                 if depth > 10:
-                    return []
+                    continue
 
-                edges = []
                 if isinstance(obj, dict):
-                    # Check for edge_owner_to_timeline_media
-                    if "edge_owner_to_timeline_media" in obj:
-                        media = obj["edge_owner_to_timeline_media"]
+                    media = obj.get("edge_owner_to_timeline_media")
+                    if isinstance(media, dict):
                         edges.extend(media.get("edges", []))
+                        break
 
-                    # Check for edges directly
-                    if "edges" in obj and isinstance(obj["edges"], list):
+                    if isinstance(obj.get("edges"), list):
                         edges.extend(obj["edges"])
 
-                    # Recurse into values
-                    for v in obj.values():
-                        edges.extend(find_edges(v, depth + 1))
+                    for key, v in obj.items():
+                        if key in ("edges", "edge_owner_to_timeline_media"):
+                            continue
+                        if isinstance(v, (dict, list)):
+                            queue.append((v, depth + 1))
 
                 elif isinstance(obj, list):
                     for item in obj:
-                        edges.extend(find_edges(item, depth + 1))
-
-                return edges
-
-            edges = find_edges(data)
+                        if isinstance(item, (dict, list)):
+                            queue.append((item, depth + 1))
 
             for edge in edges:
                 node = edge.get("node", edge)
@@ -291,88 +517,62 @@ class InstagramCollector(BaseCollector):
                     continue
 
                 post_id = node.get("id") or node.get("pk")
+                if not post_id or not is_new(f"instagram_{post_id}"):
+                    continue
                 shortcode = node.get("shortcode")
 
-                # Get caption text
-                caption = ""
-                caption_edges = node.get("edge_media_to_caption", {}).get("edges", [])
-                if caption_edges:
-                    caption = caption_edges[0].get("node", {}).get("text", "")
-                elif "caption" in node:
-                    cap = node["caption"]
-                    if isinstance(cap, dict):
-                        caption = cap.get("text", "")
-                    elif isinstance(cap, str):
-                        caption = cap
-
-                timestamp = node.get("taken_at_timestamp") or node.get("taken_at")
-
-                if post_id and (caption or shortcode):
-                    posts.append({
-                        "id": str(post_id),
-                        "shortcode": shortcode,
-                        "text": caption,
-                        "timestamp": timestamp,
-                        "username": username,
-                        "like_count": node.get("edge_liked_by", {}).get("count", 0)
-                                     or node.get("like_count", 0),
-                        "comment_count": node.get("edge_media_to_comment", {}).get("count", 0)
-                                        or node.get("comment_count", 0),
-                    })
+                caption = _extract_caption(node)
+
+                if caption and not self._post_is_relevant(caption, username):
+                    continue
+
+                if caption or shortcode:
+                    posts.append(
+                        _post_from_node(node, post_id, shortcode, caption, username)
+                    )
 
         except Exception as e:
             logger.debug("[instagram] Error parsing __NEXT_DATA__: %s", e)
 
         return posts
 
-    def _parse_api_response(self, data: dict, username: str) -> list[dict]:
-        """Extract posts from Instagram API response."""
+    def _parse_api_response(
+        self, data: dict, username: str, is_new: Callable[[str], bool]
+    ) -> list[_ParsedPost]:
+        """Extract new, relevant posts from an Instagram API response."""
         posts = []
         try:
             # Try to find items/posts in the response
             items = data.get("items", [])
             if not items:
-                items = data.get("data", {}).get("user", {}).get("edge_owner_to_timeline_media", {}).get("edges", [])
+                items = (
+                    data.get("data", _EMPTY).get("user", _EMPTY)
+                    .get("edge_owner_to_timeline_media", _EMPTY).get("edges", [])
+                )
 
             for item in items:
                 node = item.get("node", item)
 
                 post_id = node.get("id") or node.get("pk")
+                if not post_id or not is_new(f"instagram_{post_id}"):
+                    continue
                 shortcode = node.get("code") or node.get("shortcode")
 
-                # Get caption
-                caption = ""
-                caption_obj = node.get("caption")
-                if isinstance(caption_obj, dict):
-                    caption = caption_obj.get("text", "")
-                elif isinstance(caption_obj, str):
-                    caption = caption_obj
-
-                # Alternative caption location
-                if not caption:
-                    edges = node.get("edge_media_to_caption", {}).get("edges", [])
-                    if edges:
-                        caption = edges[0].get("node", {}).get("text", "")
-
-                timestamp = node.get("taken_at_timestamp") or node.get("taken_at")
-
-                if post_id:
-                    posts.append({
-                        "id": str(post_id),
-                        "shortcode": shortcode,
-                        "text": caption,
-                        "timestamp": timestamp,
-                        "username": username,
-                        "like_count": node.get("like_count", 0),
-                        "comment_count": node.get("comment_count", 0),
-                    })
+                caption = _extract_caption(node)
+
+                if caption and not self._post_is_relevant(caption, username):
+                    continue
+
+                posts.append(
+                    _post_from_node(node, post_id, shortcode, caption, username)
+                )
 
         except Exception as e:
             logger.debug("[instagram] Error parsing API response: %s", e)
 
         return posts
 
-    async def _extract_from_html(self, page, username: str) -> list[dict]:
+    async def _extract_from_html(self, page, username: str) -> list[_ParsedPost]:
         """Extract post links from HTML as a fallback."""
         posts = []
         try:
@@ -386,18 +586,16 @@ class InstagramCollector(BaseCollector):
 
             for link in links:
                 # Extract shortcode from URL like /p/ABC123/
-                match = re.search(r"/p/([A-Za-z0-9_-]+)/", link)
+                match = _POST_SHORTCODE_RE.search(link)
                 if match:
                     shortcode = match.group(1)
-                    posts.append({
-                        "id": shortcode,
-                        "shortcode": shortcode,
-                        "text": "",  # Would need to load each post to get caption
-                        "timestamp": None,
-                        "username": username,
-                        "like_count": 0,
-                        "comment_count": 0,
-                    })
+                    posts.append(_ParsedPost(
+                        id=shortcode,
+                        shortcode=shortcode,
+                        text="",  # Would need to load each post to get caption
+                        timestamp=None,
+                        username=username,
+                    ))
 
         except Exception as e:
             logger.debug("[instagram] Error extracting from HTML: %s", e)
@@ -434,68 +632,80 @@ class InstagramCollector(BaseCollector):
             ", @".join(accounts_this_cycle)
         )
 
-        for username in accounts_this_cycle:
-            try:
-                posts = await self._scrape_profile(username)
-
-                for post in posts:
-                    post_id = post.get("id", "")
-                    text = post.get("text", "")
-                    shortcode = post.get("shortcode", post_id)
-
-                    source_id = f"instagram_{post_id}"
-
-                    if not self._is_new(source_id):
-                        continue
-
-                    # Check relevance (or pass through if no text - we got the link)
-                    if text and not self._post_is_relevant(text, username):
-                        continue
-
-                    timestamp = _parse_instagram_timestamp(post.get("timestamp"))
-
-                    # Build post URL
-                    if shortcode:
-                        source_url = f"https://www.instagram.com/p/{shortcode}/"
-                    else:
-                        source_url = f"https://www.instagram.com/{username}/"
-
-                    reports.append(
-                        RawReport(
-                            source_type="instagram",
-                            source_id=source_id,
-                            source_url=source_url,
-                            author=f"@{username}",
-                            text=text or f"[Instagram post from @{username}]",
-                            timestamp=timestamp,
-                            collected_at=now,
-                            raw_metadata={
-                                "post_id": post_id,
-                                "shortcode": shortcode,
-                                "username": username,
-                                "like_count": post.get("like_count", 0),
-                                "comment_count": post.get("comment_count", 0),
-                            },
-                        )
-                    )
-
-                # Rate limit between accounts
-                await asyncio.sleep(3)
-
-            except Exception as e:
-                logger.warning("[instagram] Error collecting from @%s: %s", username, e)
+        # Scrape this cycle's accounts concurrently; the semaphore is the
+        # rate limiter (each scrape uses its own page in the shared context)
+        sem = asyncio.BoundedSemaphore(self._accounts_per_cycle)
+        results = await asyncio.gather(
+            *(self._scrape_one(u, sem, now) for u in accounts_this_cycle),
+            return_exceptions=True,
+        )
+        for username, result in zip(accounts_this_cycle, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "[instagram] Error collecting from @%s: %s", username, result
+                )
+                continue
+            reports.extend(result)
 
         if reports:
             logger.info("[instagram] Found %d relevant posts", len(reports))
 
         return reports
 
+    async def _scrape_one(
+        self,
+        username: str,
+        sem: asyncio.BoundedSemaphore,
+        now: datetime,
+    ) -> list[RawReport]:
+        """Scrape one profile and build reports for its relevant posts."""
+        async with sem:
+            posts = await self._scrape_profile(username)
+
+        reports: list[RawReport] = []
+        for post in posts:
+            post_id = post.id
+            text = post.text
+            shortcode = post.shortcode
+
+            # Posts arrive already deduped and relevance-checked
+            source_id = f"instagram_{post_id}"
+            timestamp = _parse_instagram_timestamp(post.timestamp)
+
+            # Build post URL
+            if shortcode:
+                source_url = f"https://www.instagram.com/p/{shortcode}/"
+            else:
+                source_url = f"https://www.instagram.com/{username}/"
+
+            reports.append(
+                RawReport(
+                    source_type="instagram",
+                    source_id=source_id,
+                    source_url=source_url,
+                    author=f"@{username}",
+                    text=text or f"[Instagram post from @{username}]",
+                    timestamp=timestamp,
+                    collected_at=now,
+                    raw_metadata={
+                        "post_id": post_id,
+                        "shortcode": shortcode,
+                        "username": username,
+                        "like_count": post.like_count,
+                        "comment_count": post.comment_count,
+                    },
+                )
+            )
+
+        return reports
+
     async def _close_browser(self) -> None:
         """Release our browser context back to the shared pool."""
         if self._pool and self._context:
             await self._pool.close_context(self._context)
 
         self._context = None
+        self._modal_dismissed = False
 
     def stop(self) -> None:
         super().stop()
@@ -13,14 +13,22 @@ empty results until the situation changes.
 from __future__ import annotations
 
 import asyncio
+import codecs
+import html
 import logging
+import re
+import sys
 from datetime import datetime, timedelta, timezone
-from html.parser import HTMLParser
+from itertools import chain
 from typing import Any
+from zoneinfo import ZoneInfo
 
 import aiohttp
+import numpy as np
 
 from collectors.base import BaseCollector
+from collectors.geo import LocaleCenters
+from collectors.http_session import get_session
 from storage.models import RawReport
 
 logger = logging.getLogger(__name__)
@@ -28,66 +36,131 @@ logger = logging.getLogger(__name__)
 # API endpoint for map data
 STOPICE_API_URL = "https://stopice.net/login/"
 
+# Per-request headers.  The browser User-Agent is StopICE-specific; the
+# shared session keeps aiohttp's own defaults for every other collector.
+_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Referer": "https://stopice.net/login/?maps=1",
+}
 
-def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance in km between two lat/lon points."""
-    import math
-    R = 6371.0
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(math.radians(lat1))
-        * math.cos(math.radians(lat2))
-        * math.sin(dlon / 2) ** 2
-    )
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+# recentmapdata windows, widest first; fetched concurrently, and the first
+# one with markers wins
+_DURATIONS = ("since_yesterday", "today")
 
+# Response bodies are parsed in chunks of this size while downloading
+_CHUNK_SIZE = 32 * 1024
 
-class StopICEDataParser(HTMLParser):
-    """Parse StopICE map data response.
+
+# One marker field per match, e.g. <lat>44.123</lat>.  The response is a
+# flat run of field tags, each marker terminated by its <map_data> tag.
+_FIELD_RE = re.compile(
+    r"<(id|lat|long|location|timestamp|comments|priorityimg|thispriority"
+    r"|media|map_data)>(.*?)</\1>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Raw-bytes check that a response carries markers at all, run before
+# anything is decoded (same test as the old lowercase "in" checks)
+_MARKER_SNIFF = re.compile(rb"<(?:map_data|lat)>", re.IGNORECASE)
+
+# Low-cardinality fields that repeat across markers; interned so each
+# distinct value is stored once
+_INTERNED_FIELDS = frozenset({"location", "thispriority", "priorityimg"})
+
+# Markup nested inside a field value (e.g. <br> in comments)
+_INNER_TAG_RE = re.compile(r"<[^>]*>")
+
+
+class _MarkerStream:
+    """Incremental parser for a StopICE map data response.
 
     The response (when available) contains elements like:
-    <map_data>...</map_data>
     <id>123</id>
     <lat>44.123</lat>
     <long>-93.456</long>
     <location>Minneapolis, MN</location>
     <timestamp>2026-02-05 10:30:00</timestamp>
     <comments>ICE spotted at...</comments>
+    <map_data>...</map_data>
+
+    Decoded text is fed chunk by chunk as it downloads; a field split
+    across chunks stays buffered until its closing tag arrives.  Empty
+    fields are skipped; values are entity-decoded and stripped.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.markers = []
-        self.current_marker = {}
-        self.current_tag = None
-        self.current_data = ""
-        self.marker_tags = {
-            "id", "lat", "long", "location", "timestamp",
-            "comments", "priorityimg", "thispriority", "media", "map_data"
-        }
-
-    def handle_starttag(self, tag, attrs):
-        tag_lower = tag.lower()
-        if tag_lower in self.marker_tags:
-            self.current_tag = tag_lower
-            self.current_data = ""
-
-    def handle_endtag(self, tag):
-        tag_lower = tag.lower()
-        if tag_lower == self.current_tag:
-            if self.current_tag and self.current_data.strip():
-                self.current_marker[self.current_tag] = self.current_data.strip()
-            if tag_lower == "map_data" and self.current_marker:
-                self.markers.append(self.current_marker.copy())
-                self.current_marker = {}
-            self.current_tag = None
-            self.current_data = ""
-
-    def handle_data(self, data):
-        if self.current_tag:
-            self.current_data += data
+    __slots__ = ("markers", "fields_seen", "_marker", "_buf")
+
+    def __init__(self) -> None:
+        self.markers: list[dict[str, str]] = []
+        self.fields_seen = 0
+        self._marker: dict[str, str] = {}
+        self._buf = ""
+
+    def feed(self, text: str) -> None:
+        buf = self._buf + text
+        end = 0
+        for match in _FIELD_RE.finditer(buf):
+            end = match.end()
+            self.fields_seen += 1
+            tag = match.group(1).lower()
+            value = match.group(2)
+            if "<" in value:
+                value = _INNER_TAG_RE.sub("", value)
+            value = html.unescape(value).strip()
+            if value:
+                if tag in _INTERNED_FIELDS:
+                    value = sys.intern(value)
+                self._marker[tag] = value
+            if tag == "map_data" and self._marker:
+                self.markers.append(self._marker)
+                self._marker = {}
+        self._buf = buf[end:]
+
+
+# Shared result for markers without usable coordinates
+_NAN_COORDS = (float("nan"), float("nan"))
+
+
+def _marker_coords(marker: dict[str, str]) -> tuple[float, float]:
+    """Return a marker's (lat, lon), or NaNs when either is unusable."""
+    try:
+        return float(marker.get("lat", "")), float(marker.get("long", ""))
+    except (ValueError, TypeError):
+        return _NAN_COORDS
+
+
+# StopICE reports marker times as naive US Central wall-clock time
+_CENTRAL = ZoneInfo("America/Chicago")
+
+# Marker timestamp layouts seen in the feed, tried in order after the
+# ISO fast path in _parse_ts()
+_TS_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %I:%M %p",
+)
+
+
+def _parse_ts(ts_str: str) -> datetime | None:
+    """Parse a marker timestamp into a naive local datetime, or None."""
+    # "YYYY-MM-DD HH:MM[:SS]" is the common case and fromisoformat is
+    # implemented in C; anything else goes through strptime
+    if len(ts_str) >= 16 and ts_str[4] == "-" and ts_str[10] in " T":
+        try:
+            parsed = datetime.fromisoformat(ts_str)
+            if parsed.tzinfo is None:
+                return parsed
+        except ValueError:
+            pass
+    strptime = datetime.strptime
+    for fmt in _TS_FORMATS:
+        try:
+            return strptime(ts_str, fmt)
+        except ValueError:
+            continue
+    return None
 
 
 class StopICECollector(BaseCollector):
@@ -101,42 +174,42 @@ class StopICECollector(BaseCollector):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._session: aiohttp.ClientSession | None = None
         self._consecutive_failures = 0
         self._last_warning_time: datetime | None = None
+        # Poll every 30 minutes unless configured otherwise
+        self._poll_interval = int(getattr(self.config, "stopice_poll_interval", 1800))
         # Locale-aware geo filter — supports multiple centers for multi-locale
         locale = self.config.locale
         self._centers = locale.centers
         self._location_keywords = {kw.lower() for kw in locale.geo_city_names}
-
-    def _is_locale_area_coords(self, lat: float, lon: float) -> bool:
-        """Check if coordinates are within any configured locale radius."""
-        try:
-            for c_lat, c_lon, c_radius in self._centers:
-                dist = _haversine_km(lat, lon, c_lat, c_lon)
-                if dist <= c_radius:
-                    return True
-            return False
-        except (ValueError, TypeError):
-            return False
+        # One alternation scanned in C instead of a Python loop of `in`
+        # checks.  Whole words only, so short names like "ga" or "atl"
+        # don't fire inside other words; longest first so "saint paul"
+        # wins over "paul".
+        self._location_re = (
+            re.compile(r"\b(?:" + "|".join(
+                re.escape(kw)
+                for kw in sorted(self._location_keywords, key=len, reverse=True)
+            ) + r")\b")
+            if self._location_keywords else None
+        )
+        # Center columns precomputed once, tested a whole batch at a time
+        self._locale_centers = LocaleCenters(self._centers)
 
     def _is_locale_area_text(self, text: str) -> bool:
         """Check if text contains locale area references."""
-        text_lower = text.lower()
-        return any(kw in text_lower for kw in self._location_keywords)
+        if self._location_re is None:
+            return False
+        return self._location_re.search(text.lower()) is not None
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        return await get_session()
 
     def get_poll_interval(self) -> int:
-        # Poll every 30 minutes
         # If experiencing failures, back off
-        base_interval = getattr(self.config, "stopice_poll_interval", 1800)
         if self._consecutive_failures > 5:
-            return base_interval * 2  # Double the interval after repeated failures
-        return base_interval
+            return self._poll_interval * 2  # Double the interval after repeated failures
+        return self._poll_interval
 
     async def collect(self) -> list[RawReport]:
         """Attempt to fetch ICE reports from StopICE.net."""
@@ -146,58 +219,20 @@ class StopICECollector(BaseCollector):
 
         session = await self._ensure_session()
 
-        # Try the recentmapdata endpoint with different durations
-        durations = ["since_yesterday", "today"]
+        # Query the recentmapdata endpoint for both durations at once, then
+        # prefer the wider window: "today" drops markers from before
+        # midnight that are still fresh
         got_response = False
-
-        for duration in durations:
-            try:
-                params = {"recentmapdata": "1", "duration": duration}
-                async with session.get(
-                    STOPICE_API_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=15),  # Short timeout
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                        "Referer": "https://stopice.net/login/?maps=1",
-                    }
-                ) as resp:
-                    if resp.status != 200:
-                        logger.debug("[stopice] API returned %d for duration=%s", resp.status, duration)
-                        continue
-
-                    content = await resp.text()
-
-                    # Check if we got actual data (not just whitespace)
-                    if not content or len(content.strip()) < 50:
-                        logger.debug("[stopice] Empty/minimal response for duration=%s", duration)
-                        continue
-
-                    # Check for marker tags
-                    if "<map_data>" not in content.lower() and "<lat>" not in content.lower():
-                        logger.debug("[stopice] No marker tags in response for duration=%s", duration)
-                        continue
-
-                    got_response = True
-
-                    # Parse the response
-                    parser = StopICEDataParser()
-                    try:
-                        parser.feed(content)
-                    except Exception as e:
-                        logger.debug("[stopice] Parse error: %s", e)
-                        continue
-
-                    if parser.markers:
-                        logger.info("[stopice] Got %d markers from duration=%s", len(parser.markers), duration)
-                        reports.extend(self._process_markers(parser.markers, now))
-                        break  # Got data, don't need to try other durations
-
-            except asyncio.TimeoutError:
-                logger.debug("[stopice] Timeout for duration=%s", duration)
-            except Exception as e:
-                logger.debug("[stopice] Error fetching duration=%s: %s", duration, e)
+        results = await asyncio.gather(
+            *(self._fetch_markers(session, d) for d in _DURATIONS)
+        )
+        for markers in results:
+            if markers is None:
+                continue
+            got_response = True
+            if markers:
+                reports.extend(self._process_markers(markers, now))
+                break  # Got data, don't need the other duration
 
         if not got_response:
             self._consecutive_failures += 1
@@ -222,53 +257,117 @@ class StopICECollector(BaseCollector):
 
         return reports
 
+    async def _fetch_markers(
+        self, session: aiohttp.ClientSession, duration: str
+    ) -> list[dict[str, str]] | None:
+        """Fetch and parse one duration's map data.
+
+        Returns the markers (possibly empty) when the endpoint answered
+        with marker data, or None for errors and unusable responses.
+        """
+        try:
+            params = {"recentmapdata": "1", "duration": duration}
+            async with session.get(
+                STOPICE_API_URL,
+                params=params,
+                headers=_REQUEST_HEADERS,
+            ) as resp:
+                if resp.status != 200:
+                    logger.debug("[stopice] API returned %d for duration=%s", resp.status, duration)
+                    return None
+
+                # Parse while downloading instead of buffering the body.
+                # Nothing is decoded until the raw bytes show a marker
+                # tag, so login/error pages are never parsed at all.
+                decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(
+                    errors="replace"
+                )
+                stream = _MarkerStream()
+                received = 0
+                pending: list[bytes] = []
+                tail = b""
+                sniffed = False
+                async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+                    received += len(chunk.strip())
+                    if not sniffed:
+                        # Carry a few bytes over so a tag split across
+                        # chunks is still seen
+                        if not _MARKER_SNIFF.search(tail + chunk):
+                            pending.append(chunk)
+                            tail = chunk[-16:]
+                            continue
+                        sniffed = True
+                        for held in pending:
+                            stream.feed(decoder.decode(held))
+                        pending.clear()
+                    stream.feed(decoder.decode(chunk))
+                stream.feed(decoder.decode(b"", final=True))
+
+                # Check if we got actual data (not just whitespace)
+                if received < 50:
+                    logger.debug("[stopice] Empty/minimal response for duration=%s", duration)
+                    return None
+
+                # Check for marker tags
+                if not sniffed:
+                    logger.debug("[stopice] No marker tags in response for duration=%s", duration)
+                    return None
+
+                markers = stream.markers
+                if markers:
+                    logger.info("[stopice] Got %d markers from duration=%s", len(markers), duration)
+                return markers
+
+        except asyncio.TimeoutError:
+            logger.debug("[stopice] Timeout for duration=%s", duration)
+        except Exception as e:
+            logger.debug("[stopice] Error fetching duration=%s: %s", duration, e)
+        return None
+
     def _process_markers(self, markers: list[dict], now: datetime) -> list[RawReport]:
         """Process parsed markers into RawReport objects."""
         reports = []
         freshness_cutoff = now - timedelta(hours=3)
 
-        for marker in markers:
+        # Pass 1: parse every marker's coordinates straight into a compact
+        # float32 column pair (NaN where missing) for the geo filter
+        n = len(markers)
+        coords = np.fromiter(
+            chain.from_iterable(map(_marker_coords, markers)),
+            dtype=np.float32,
+            count=2 * n,
+        ).reshape(n, 2)
+        has_coords = ~np.isnan(coords[:, 0])
+        in_area_coords = self._locale_centers.within(coords[:, 0], coords[:, 1])
+
+        # Pass 2: build reports for markers in the area
+        for i, marker in enumerate(markers):
             try:
-                # Parse coordinates
-                lat = None
-                lon = None
-                try:
-                    lat = float(marker.get("lat", ""))
-                    lon = float(marker.get("long", ""))
-                except (ValueError, TypeError):
-                    pass
-
                 location = marker.get("location", "")
                 comments = marker.get("comments", "")
 
-                # Check if in locale area
-                in_area = False
-                if lat is not None and lon is not None:
-                    in_area = self._is_locale_area_coords(lat, lon)
-                if not in_area:
-                    in_area = self._is_locale_area_text(f"{location} {comments}")
+                # Check if in locale area (text fallback when coords miss)
+                in_area = in_area_coords[i] or self._is_locale_area_text(
+                    f"{location} {comments}"
+                )
 
                 if not in_area:
                     continue
 
+                # Full-precision coordinates only for the survivors
+                lat = lon = None
+                if has_coords[i]:
+                    lat = float(marker["lat"])
+                    lon = float(marker["long"])
+
                 # Parse timestamp
                 timestamp = now
                 ts_str = marker.get("timestamp", "")
                 if ts_str:
-                    for fmt in [
-                        "%Y-%m-%d %H:%M:%S",
-                        "%Y-%m-%d %H:%M",
-                        "%m/%d/%Y %H:%M:%S",
-                        "%m/%d/%Y %I:%M %p",
-                    ]:
-                        try:
-                            timestamp = datetime.strptime(ts_str, fmt)
-                            timestamp = timestamp.replace(tzinfo=timezone.utc)
-                            # Adjust from Central to UTC (+6 hours)
-                            timestamp = timestamp + timedelta(hours=6)
-                            break
-                        except ValueError:
-                            continue
+                    parsed = _parse_ts(ts_str)
+                    if parsed is not None:
+                        # Feed times are US Central; convert to UTC with DST
+                        timestamp = parsed.replace(tzinfo=_CENTRAL).astimezone(timezone.utc)
 
                 # Check freshness
                 if timestamp < freshness_cutoff:
@@ -320,7 +419,3 @@ class StopICECollector(BaseCollector):
                 continue
 
         return reports
-
-    async def cleanup(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
@@ -12,7 +12,9 @@ Strategy:
 NOTE: Government ICE/DHS accounts are deliberately excluded — they only
 post after-the-fact press releases, not real-time actionable information.
 
-The browser context persists between cycles to reuse the session.
+The browser context persists between cycles to reuse the session, and is
+recreated (carrying its cookies/storage) once it has opened enough pages,
+since long-lived Playwright contexts keep growing in memory.
 
 IMPORTANT: This approach may violate Twitter/X Terms of Service.
 Use at your own discretion.
@@ -21,13 +23,15 @@ Use at your own discretion.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import re
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import Iterable
+
+import orjson
 
 from collectors.base import BaseCollector
 from storage.models import RawReport
@@ -43,36 +47,92 @@ ACCOUNT_CACHE_FILE = Path(".twitter_account_cache.json")
 # Max age for account to be considered active (3 months = ~90 days)
 ACCOUNT_STALE_DAYS = 90
 
+# Pages opened in one browser context before it is recycled
+_CONTEXT_RECYCLE_PAGES = 50
+
+# Distinct screen names remembered by the focused-account lookup
+_SN_CACHE_SIZE = 4096
+
 # ── ICE keyword regex (universal — not locale-specific) ──────────────
 
 ICE_KEYWORDS_RE = re.compile(
+    # Prefix-factored: one branch per leading word.  A bare "ice" already
+    # matches every "ice <noun>" phrase, so those need no branches of
+    # their own; likewise for the deport* and immigration* variants.
     r"\b(?:"
     r"ice\b|"
-    r"immigration\s+(?:enforce|raid|arrest|agent|sweep|operation|custom)|"
-    r"deportat|"
-    r"deport(?:ed|ing|s)\b|"
+    r"immigration\s+(?:enforce|raid|arrest|agent|sweep|operation|custom|checkpoint)|"
+    r"deport(?:at|(?:ed|ing|s)\b)|"
     r"federal\s+agent|"
-    r"ice\s+(?:officer|agent|arrest|raid|detain|surge|watch)|"
     r"operation\s+(?:metro\s+surge|safeguard|aurora)|"
     r"ero\b|"
     r"detention|"
     r"undocumented|"
-    r"immigration\s+checkpoint|"
-    r"ice\s+sighting|"
-    r"ice\s+spotted|"
     r"know\s+your\s+rights|"
     r"rapid\s+response|"
     r"community\s+alert|"
     r"unmarked\s+(?:van|vehicle|car|suv)"
     r")",
-    re.IGNORECASE,
+    # Case-sensitive on purpose: callers search lowercased text
+)
+
+# Cheap substring prefilter: every ICE_KEYWORDS_RE alternative contains at
+# least one of these, so a tweet with none of them can't match.  Keep in
+# sync with the regex; multi-word phrases use a single word because the
+# regex allows any whitespace between words.
+_ICE_TRIGGERS = (
+    "ice", "immigration", "deport", "federal", "operation", "ero",
+    "detention", "undocumented", "rights", "rapid", "alert", "unmarked",
 )
 
 
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+# GraphQL operation name from an API URL such as
+# https://x.com/i/api/graphql/<queryId>/UserTweets?variables=...
+_GRAPHQL_RE = re.compile(r"/graphql/[^/]+/(SearchTimeline|UserTweets)\b")
+
+
+def _graphql_listener(operation: str, sink: list[dict]):
+    """Build a page "response" handler collecting one GraphQL operation.
+
+    Every response on the page goes through the handler, so it rejects
+    on status and a single regex over the URL before touching the body.
+    """
+    async def on_response(response) -> None:
+        if response.status != 200:
+            return
+        match = _GRAPHQL_RE.search(response.url)
+        if match is None or match.group(1) != operation:
+            return
+        try:
+            sink.append(orjson.loads(await response.body()))
+        except Exception:
+            pass
+
+    return on_response
+
+
 def _parse_twitter_date(date_str: str) -> datetime | None:
     """Parse Twitter's date format: 'Thu Feb 05 17:05:15 +0000 2026'."""
     if not date_str:
         return None
+    # Fast path: the API always sends this fixed layout in UTC
+    parts = date_str.split()
+    if len(parts) == 6 and parts[4] == "+0000":
+        try:
+            hour, minute, second = parts[3].split(":")
+            return datetime(
+                int(parts[5]), _MONTHS[parts[1]], int(parts[2]),
+                int(hour), int(minute), int(second),
+                tzinfo=timezone.utc,
+            )
+        except (KeyError, ValueError):
+            pass
     try:
         return parsedate_to_datetime(date_str)
     except Exception:
@@ -91,36 +151,38 @@ def _extract_tweet_entry(tr: dict) -> dict | None:
     elif typename != "Tweet":
         return None
 
+    # Nested paths are read with plain indexing: the happy path allocates
+    # no throwaway {} defaults, and a missing level lands in the except
     text = ""
-    note = tr.get("note_tweet", {})
-    if note:
-        note_results = note.get("note_tweet_results", {}).get("result", {})
-        text = note_results.get("text", "")
+    if "note_tweet" in tr:
+        try:
+            text = tr["note_tweet"]["note_tweet_results"]["result"]["text"]
+        except (KeyError, TypeError):
+            pass
 
-    legacy = tr.get("legacy", {})
+    legacy = tr.get("legacy") or {}
     if not text:
         text = legacy.get("full_text", "")
 
     if not text:
         return None
 
-    core = tr.get("core", {})
-    user_r = core.get("user_results", {}).get("result", {})
-    user_leg = user_r.get("legacy", {})
-    screen_name = user_leg.get("screen_name", "")
-    display_name = user_leg.get("name", "")
-
-    tweet_id = tr.get("rest_id", "") or legacy.get("id_str", "")
-    created_at = legacy.get("created_at", "")
+    try:
+        user_leg = tr["core"]["user_results"]["result"]["legacy"]
+        screen_name = user_leg.get("screen_name", "")
+        display_name = user_leg.get("name", "")
+    except (KeyError, TypeError, AttributeError):
+        screen_name = display_name = ""
 
+    lget = legacy.get
     return {
-        "id": tweet_id,
+        "id": tr.get("rest_id", "") or lget("id_str", ""),
         "text": text,
-        "created_at": created_at,
+        "created_at": lget("created_at", ""),
         "screen_name": screen_name,
         "display_name": display_name,
-        "retweet_count": legacy.get("retweet_count", 0),
-        "favorite_count": legacy.get("favorite_count", 0),
+        "retweet_count": lget("retweet_count", 0),
+        "favorite_count": lget("favorite_count", 0),
         "is_retweet": text.startswith("RT @"),
     }
 
@@ -128,18 +190,19 @@ def _extract_tweet_entry(tr: dict) -> dict | None:
 def _extract_tweets_from_entries(entries: list) -> list[dict]:
     """Walk a list of timeline entries and extract tweet dicts."""
     tweets = []
+    append = tweets.append
     for entry in entries:
-        entry_id = entry.get("entryId", "")
-        if not entry_id.startswith("tweet-"):
+        if not entry.get("entryId", "").startswith("tweet-"):
             continue
 
-        content = entry.get("content", {})
-        ic = content.get("itemContent", {})
-        tr = ic.get("tweet_results", {}).get("result", {})
+        try:
+            tr = entry["content"]["itemContent"]["tweet_results"]["result"]
+        except (KeyError, TypeError):
+            continue
 
         tweet = _extract_tweet_entry(tr)
         if tweet:
-            tweets.append(tweet)
+            append(tweet)
 
     return tweets
 
@@ -150,11 +213,13 @@ def _extract_tweets_from_graphql(data: dict) -> list[dict]:
 
     def _walk_instructions(instructions: list) -> None:
         for inst in instructions:
-            entries = inst.get("entries", [])
+            # TimelinePinEntry: flagged, since it sits outside date order
             pin_entry = inst.get("entry")
             if pin_entry:
-                entries = [pin_entry] + list(entries)
-            tweets.extend(_extract_tweets_from_entries(entries))
+                for tweet in _extract_tweets_from_entries([pin_entry]):
+                    tweet["is_pinned"] = True
+                    tweets.append(tweet)
+            tweets.extend(_extract_tweets_from_entries(inst.get("entries", [])))
 
     try:
         user_result = data.get("data", {}).get("user", {}).get("result", {})
@@ -170,31 +235,33 @@ def _extract_tweets_from_graphql(data: dict) -> list[dict]:
     return tweets
 
 
-def _extract_tweets_from_search(data: dict) -> list[dict]:
-    """Parse Twitter's GraphQL SearchTimeline response into flat tweet dicts."""
-    tweets = []
+def _extract_tweets_from_search_many(datas: Iterable[dict]) -> list[dict]:
+    """Parse SearchTimeline GraphQL responses into one flat tweet list.
 
-    try:
-        search_tl = (
-            data.get("data", {})
-            .get("search_by_raw_query", {})
-            .get("search_timeline", {})
-            .get("timeline", {})
-        )
-        instructions = search_tl.get("instructions", [])
+    A search page fires several SearchTimeline responses (pagination,
+    retries); they are walked in a single pass into one list.
+    """
+    tweets: list[dict] = []
+    extend = tweets.extend
 
-        for inst in instructions:
-            inst_type = inst.get("type", "")
-            # TimelineAddEntries is the main one
-            if inst_type == "TimelineAddEntries":
-                entries = inst.get("entries", [])
-                tweets.extend(_extract_tweets_from_entries(entries))
-            # Also check for entries directly on the instruction
-            elif "entries" in inst:
-                tweets.extend(_extract_tweets_from_entries(inst["entries"]))
+    for data in datas:
+        try:
+            instructions = (
+                data["data"]["search_by_raw_query"]["search_timeline"]
+                ["timeline"]["instructions"]
+            )
+        except (KeyError, TypeError):
+            continue
 
-    except Exception as e:
-        logger.debug("[twitter] Search GraphQL parse error: %s", e)
+        try:
+            # TimelineAddEntries is the main one, but any instruction
+            # carrying entries is walked
+            for inst in instructions:
+                entries = inst.get("entries")
+                if entries:
+                    extend(_extract_tweets_from_entries(entries))
+        except Exception as e:
+            logger.debug("[twitter] Search GraphQL parse error: %s", e)
 
     return tweets
 
@@ -216,10 +283,20 @@ class TwitterCollector(BaseCollector):
 
     name = "twitter"
 
+    # Browser identity for every context this collector creates (first
+    # launch and each recycle)
+    _UA = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+    _VIEWPORT = {"width": 1280, "height": 900}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._pool = None          # set in _ensure_browser
         self._context = None
+        self._pages_opened = 0     # pages opened in the current context
         self._logged_in = False
         self._login_failed = False
         self._accounts_per_cycle = 5
@@ -228,7 +305,8 @@ class TwitterCollector(BaseCollector):
         self._accounts_validated = False
         # Build locale-aware data
         locale = self.config.locale
-        self._geo_re = locale.build_geo_regex()
+        # Lowercase pattern, matched against lowercased tweet text
+        self._geo_re = locale.build_geo_regex(ignore_case=False)
         self._search_queries = list(locale.twitter_search_queries)
         self._all_monitored = (
             list(locale.twitter_reporter_accounts)
@@ -236,18 +314,31 @@ class TwitterCollector(BaseCollector):
             + list(locale.twitter_news_accounts)
             + list(locale.twitter_official_accounts)
         )
-        self._focused_accounts = {h.lower() for h in locale.twitter_all_mn_focused}
+        self._focused_accounts = frozenset(
+            h.lower() for h in locale.twitter_all_mn_focused
+        )
+        # screen_name -> is focused; authors repeat across a cycle
+        self._sn_cache: dict[str, bool] = {}
 
     def _tweet_is_relevant(self, text: str, screen_name: str) -> bool:
         """Check if a tweet is about ICE enforcement in the locale area."""
-        sn_lower = screen_name.lower()
-        has_ice = bool(ICE_KEYWORDS_RE.search(text))
-        has_geo = bool(self._geo_re.search(text))
+        text_lower = text.lower()
+        if not any(t in text_lower for t in _ICE_TRIGGERS):
+            return False
 
-        if sn_lower in self._focused_accounts:
+        has_ice = bool(ICE_KEYWORDS_RE.search(text_lower))
+
+        focused = self._sn_cache.get(screen_name)
+        if focused is None:
+            if len(self._sn_cache) >= _SN_CACHE_SIZE:
+                self._sn_cache.clear()
+            focused = screen_name.lower() in self._focused_accounts
+            self._sn_cache[screen_name] = focused
+
+        if focused:
             return has_ice
 
-        return has_ice and has_geo
+        return has_ice and self._geo_re.search(text_lower) is not None
 
     @property
     def _has_credentials(self) -> bool:
@@ -262,19 +353,12 @@ class TwitterCollector(BaseCollector):
             from collectors.browser_pool import BrowserPool
 
             self._pool = BrowserPool.shared()
-            self._context = await self._pool.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1280, "height": 900},
-            )
+            self._context = await self._new_context()
 
             # Try to restore saved cookies
             if COOKIE_FILE.exists():
                 try:
-                    cookies = json.loads(COOKIE_FILE.read_text())
+                    cookies = orjson.loads(COOKIE_FILE.read_bytes())
                     await self._context.add_cookies(cookies)
                     self._logged_in = True
                     logger.info("[twitter] Restored saved session cookies")
@@ -289,13 +373,54 @@ class TwitterCollector(BaseCollector):
             await self._close_browser()
             return False
 
+    async def _new_context(self, **kwargs):
+        """Create a browser context with this collector's UA/viewport."""
+        self._pages_opened = 0
+        return await self._pool.new_context(
+            user_agent=self._UA, viewport=self._VIEWPORT, **kwargs
+        )
+
+    async def _new_page(self):
+        """Open a page in the current context, counting it toward recycling."""
+        self._pages_opened += 1
+        return await self._context.new_page()
+
+    async def _maybe_recycle_context(self) -> None:
+        """Swap in a fresh context once the current one has opened many pages.
+
+        Called between cycles, when no pages are open.  The storage state
+        (cookies + localStorage) is snapshotted in memory and handed to the
+        new context, so the logged-in session carries over.
+        """
+        if self._context is None or self._pages_opened < _CONTEXT_RECYCLE_PAGES:
+            return
+        try:
+            state = await self._context.storage_state()
+        except Exception as e:
+            logger.debug("[twitter] Could not snapshot storage state: %s", e)
+            return
+
+        if self._logged_in:
+            await self._save_cookies()
+        await self._pool.close_context(self._context)
+        self._context = None
+        try:
+            self._context = await self._new_context(storage_state=state)
+            logger.info(
+                "[twitter] Recycled browser context after %d pages",
+                _CONTEXT_RECYCLE_PAGES,
+            )
+        except Exception as e:
+            # _ensure_browser rebuilds from the cookie file next cycle
+            logger.warning("[twitter] Failed to recycle browser context: %s", e)
+
     async def _save_cookies(self) -> None:
         """Save current browser cookies to disk."""
         if self._context is None:
             return
         try:
             cookies = await self._context.cookies()
-            COOKIE_FILE.write_text(json.dumps(cookies, indent=2))
+            COOKIE_FILE.write_bytes(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
             logger.debug("[twitter] Saved %d cookies to %s", len(cookies), COOKIE_FILE)
         except Exception as e:
             logger.debug("[twitter] Failed to save cookies: %s", e)
@@ -325,7 +450,7 @@ class TwitterCollector(BaseCollector):
             self._login_failed = True
             return False
 
-        page = await self._context.new_page()
+        page = await self._new_page()
         try:
             logger.info("[twitter] Login attempt %d for @%s ...", self._login_attempts, username)
 
@@ -520,7 +645,7 @@ class TwitterCollector(BaseCollector):
         if self._context is None:
             return False
 
-        page = await self._context.new_page()
+        page = await self._new_page()
         try:
             print("\n" + "=" * 60)
             print("  MANUAL X/TWITTER LOGIN REQUIRED")
@@ -609,7 +734,7 @@ class TwitterCollector(BaseCollector):
 
         # Try saved cookies
         if COOKIE_FILE.exists():
-            page = await self._context.new_page()
+            page = await self._new_page()
             try:
                 await page.goto("https://x.com/home", wait_until="domcontentloaded", timeout=15000)
                 await asyncio.sleep(3)
@@ -643,17 +768,8 @@ class TwitterCollector(BaseCollector):
 
         api_data: list[dict] = []
 
-        async def on_response(response) -> None:
-            url = response.url
-            if response.status == 200 and "SearchTimeline" in url:
-                try:
-                    data = await response.json()
-                    api_data.append(data)
-                except Exception:
-                    pass
-
-        page = await self._context.new_page()
-        page.on("response", on_response)
+        page = await self._new_page()
+        page.on("response", _graphql_listener("SearchTimeline", api_data))
 
         try:
             # URL-encode the query
@@ -670,9 +786,7 @@ class TwitterCollector(BaseCollector):
                 self._logged_in = False
                 return []
 
-            tweets: list[dict] = []
-            for data in api_data:
-                tweets.extend(_extract_tweets_from_search(data))
+            tweets = _extract_tweets_from_search_many(api_data)
 
             if tweets:
                 logger.debug(
@@ -695,7 +809,7 @@ class TwitterCollector(BaseCollector):
         """Load cached account validation results."""
         if ACCOUNT_CACHE_FILE.exists():
             try:
-                return json.loads(ACCOUNT_CACHE_FILE.read_text())
+                return orjson.loads(ACCOUNT_CACHE_FILE.read_bytes())
             except Exception:
                 pass
         return {}
@@ -703,7 +817,7 @@ class TwitterCollector(BaseCollector):
     def _save_account_cache(self, cache: dict) -> None:
         """Save account validation results to disk."""
         try:
-            ACCOUNT_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+            ACCOUNT_CACHE_FILE.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.debug("[twitter] Failed to save account cache: %s", e)
 
@@ -719,27 +833,20 @@ class TwitterCollector(BaseCollector):
         if self._context is None:
             return {"exists": False, "error": "No browser context"}
 
+        now = datetime.now(timezone.utc)
         result = {
             "account": account,
             "exists": True,
             "last_tweet_date": None,
             "is_stale": False,
             "error": None,
-            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checked_at": now.isoformat(),
         }
 
         api_data: list[dict] = []
 
-        async def on_response(response) -> None:
-            if response.status == 200 and "UserTweets" in response.url:
-                try:
-                    data = await response.json()
-                    api_data.append(data)
-                except Exception:
-                    pass
-
-        page = await self._context.new_page()
-        page.on("response", on_response)
+        page = await self._new_page()
+        page.on("response", _graphql_listener("UserTweets", api_data))
 
         try:
             await page.goto(
@@ -771,17 +878,23 @@ class TwitterCollector(BaseCollector):
                 result["error"] = "No tweets found"
                 return result
 
-            # Find the most recent tweet date
+            # Find the most recent tweet date.  Apart from the pinned
+            # tweet, timelines come newest-first, so the first unpinned
+            # date inside the staleness window is the newest one: stop
+            # there.  A pinned tweet only competes for the maximum.
+            stale_before = now - timedelta(days=ACCOUNT_STALE_DAYS)
             latest_date = None
             for tweet in tweets:
                 ts = _parse_twitter_date(tweet.get("created_at", ""))
                 if ts and (latest_date is None or ts > latest_date):
                     latest_date = ts
+                if ts and ts > stale_before and not tweet.get("is_pinned"):
+                    break
 
             if latest_date:
                 result["last_tweet_date"] = latest_date.isoformat()
                 # Check if stale (no posts in 3+ months)
-                days_since = (datetime.now(timezone.utc) - latest_date).days
+                days_since = (now - latest_date).days
                 result["is_stale"] = days_since > ACCOUNT_STALE_DAYS
                 result["days_since_last_post"] = days_since
 
@@ -884,16 +997,8 @@ class TwitterCollector(BaseCollector):
 
         api_data: list[dict] = []
 
-        async def on_response(response) -> None:
-            if response.status == 200 and "UserTweets" in response.url:
-                try:
-                    data = await response.json()
-                    api_data.append(data)
-                except Exception:
-                    pass
-
-        page = await self._context.new_page()
-        page.on("response", on_response)
+        page = await self._new_page()
+        page.on("response", _graphql_listener("UserTweets", api_data))
 
         try:
             await page.goto(
@@ -982,6 +1087,7 @@ class TwitterCollector(BaseCollector):
         return reports
 
     async def collect(self) -> list[RawReport]:
+        await self._maybe_recycle_context()
         if not await self._ensure_browser():
             return []
 
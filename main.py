@@ -464,6 +464,10 @@ class ICEMonitor:
             from collectors.browser_pool import BrowserPool
             await BrowserPool.shared().shutdown()
 
+            # Close the shared aiohttp session used by HTTP collectors
+            from collectors.http_session import close_session
+            await close_session()
+
             # Restore default handler after teardown settles
             await asyncio.sleep(0.5)
             loop.set_exception_handler(_orig_handler)
@@ -516,7 +520,13 @@ def main() -> None:
     else:
         signal.signal(signal.SIGBREAK, _signal_handler)
 
-    asyncio.run(monitor.run())
+    # libuv-backed event loop where available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(monitor.run())
+    else:
+        uvloop.run(monitor.run())
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ import logging
 import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -83,21 +84,35 @@ class Locale:
 
     # ── Derived helpers ───────────────────────────────────────────
 
-    def build_geo_regex(self) -> re.Pattern[str]:
+    def build_geo_regex(self, ignore_case: bool = True) -> re.Pattern[str]:
         """Build a compiled regex that matches any geo keyword.
 
         Useful for collectors that do regex-based filtering on text.
         Multi-word phrases get ``\\s+`` or ``[\\s-]`` between words so
         they match across whitespace variants.
+
+        With ``ignore_case=False`` the keywords are lowercased and the
+        pattern is compiled case-sensitively, for callers that lowercase
+        the text themselves before searching.
         """
-        parts: list[str] = []
-        for kw in sorted(self.geo_keywords, key=lambda k: len(str(k)), reverse=True):
-            escaped = re.escape(kw)
-            # Allow flexible whitespace/hyphens in multi-word keywords
-            escaped = re.sub(r"\\ ", r"[\\s-]+", escaped)
-            parts.append(escaped)
-        pattern = r"\b(?:" + "|".join(parts) + r")\b"
-        return re.compile(pattern, re.IGNORECASE)
+        return _compile_geo_regex(self.geo_keywords, ignore_case)
+
+
+@lru_cache(maxsize=8)
+def _compile_geo_regex(
+    geo_keywords: frozenset[str], ignore_case: bool
+) -> re.Pattern[str]:
+    """Compile the geo regex once per keyword set, shared by all collectors."""
+    parts: list[str] = []
+    for kw in sorted(geo_keywords, key=lambda k: len(str(k)), reverse=True):
+        if not ignore_case:
+            kw = kw.lower()
+        escaped = re.escape(kw)
+        # Allow flexible whitespace/hyphens in multi-word keywords
+        escaped = re.sub(r"\\ ", r"[\\s-]+", escaped)
+        parts.append(escaped)
+    pattern = r"\b(?:" + "|".join(parts) + r")\b"
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
 
 
 # ---------------------------------------------------------------------------
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class RawReport:
     """Standardized output from any collector."""
     source_type: str          # "twitter", "reddit", "rss"
@@ -0,0 +1,61 @@
+"""BloomFilter dedupe."""
+
+import asyncio
+
+import pytest
+
+from collectors.base import BaseCollector
+from collectors.bloom import BloomFilter
+from config import Config
+
+
+def test_no_false_negatives():
+    bf = BloomFilter(capacity=5_000, error_rate=0.01)
+    keys = [f"bluesky_{i}" for i in range(5_000)]
+    for key in keys:
+        bf.add(key)
+    assert all(key in bf for key in keys)
+    assert len(bf) == 5_000
+
+
+def test_false_positive_rate_near_target():
+    bf = BloomFilter(capacity=5_000, error_rate=0.01)
+    for i in range(5_000):
+        bf.add(f"seen_{i}")
+    hits = sum(f"unseen_{i}" in bf for i in range(20_000))
+    # Filled to capacity the expected rate is ~1%; allow sampling noise
+    assert hits / 20_000 < 0.02
+
+
+def test_resets_once_capacity_is_exceeded():
+    bf = BloomFilter(capacity=100, error_rate=0.01)
+    for i in range(100):
+        bf.add(f"old_{i}")
+    bf.add("new")
+    assert len(bf) == 1
+    assert "new" in bf
+    assert sum(f"old_{i}" in bf for i in range(100)) <= 5
+
+
+def test_is_new_dedupes_through_the_filter():
+    class _Collector(BaseCollector):
+        async def collect(self):
+            return []
+
+        def get_poll_interval(self):
+            return 60
+
+    collector = _Collector(Config(), asyncio.Queue())
+    assert collector._is_new("rss_1")
+    assert not collector._is_new("rss_1")
+    assert collector._is_new("rss_2")
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"capacity": 0},
+    {"error_rate": 0.0},
+    {"error_rate": 1.0},
+])
+def test_rejects_bad_parameters(kwargs):
+    with pytest.raises(ValueError):
+        BloomFilter(**kwargs)
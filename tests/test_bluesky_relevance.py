@@ -0,0 +1,66 @@
+"""Bluesky relevance filtering."""
+
+import asyncio
+import random
+import re
+
+import pytest
+
+from collectors.bluesky_collector import ICE_KEYWORDS_RE, BlueskyCollector
+from config import Config
+
+
+@pytest.fixture(scope="module")
+def collector():
+    return BlueskyCollector(Config(), asyncio.Queue())
+
+
+@pytest.mark.parametrize("text", [
+    "mi compañero de minneapolis",
+    "el niñero vive en minneapolis",
+    "sinceramente, ¡qué sincero!",
+])
+def test_word_boundaries_respect_non_ascii_letters(collector, text):
+    # "ero" must not match inside a word just because its neighbour is
+    # a non-ASCII letter
+    assert ICE_KEYWORDS_RE.search(text) is None
+    assert collector._relevance_mask([text], ["someone.bsky.social"]) == [False]
+
+
+def test_keyword_next_to_non_ascii_punctuation_still_matches(collector):
+    text = "¡ice en minneapolis!"
+    assert ICE_KEYWORDS_RE.search(text) is not None
+    assert collector._relevance_mask([text], ["someone.bsky.social"]) == [True]
+
+
+def test_mask_matches_per_post_regex(collector):
+    # The batched scan must agree with checking each post on its own
+    # (the pre-batching behaviour, case-insensitive on the raw text)
+    ice_re = re.compile(ICE_KEYWORDS_RE.pattern, re.IGNORECASE)
+    geo_re = collector.config.locale.build_geo_regex()
+    words = [
+        "ICE", "ice raid", "Immigration  agents", "deportation", "ERO",
+        "federal agent", "detention", "unmarked van", "police", "nice",
+        "ice-cold", "compañero", "İstanbul", "—", "\n", "#", "the", "near",
+        *sorted(collector.config.locale.geo_keywords),
+    ]
+    handles = [*sorted(collector._focused_accounts), "someone.bsky.social"]
+    rng = random.Random(0)
+
+    for _ in range(500):
+        texts = [
+            rng.choice([" ", "", "-"]).join(
+                rng.choice(words) for _ in range(rng.randint(0, 6))
+            )
+            for _ in range(rng.randint(0, 6))
+        ]
+        authors = [rng.choice(handles).upper() for _ in texts]
+        expected = []
+        for text, author in zip(texts, authors):
+            has_ice = ice_re.search(text) is not None
+            has_geo = geo_re.search(text) is not None
+            if author.lower() in collector._focused_accounts:
+                expected.append(has_ice)
+            else:
+                expected.append(has_ice and has_geo)
+        assert collector._relevance_mask(texts, authors) == expected, texts
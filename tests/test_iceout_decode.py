@@ -0,0 +1,90 @@
+"""Iceout report-feed decoding and locale filtering."""
+
+import asyncio
+
+import msgspec
+import orjson
+import pytest
+
+from collectors.iceout_collector import (
+    CATEGORY_LABELS,
+    IceoutCollector,
+    IceoutReport,
+    _decode_feed,
+    _enum_label,
+    _extract_coords,
+)
+from config import Config
+
+GOOD = {
+    "id": 42,
+    "location": '{"type": "Point", "coordinates": [-93.26, 44.97]}',
+    "location_description": "Lake St, Minneapolis",
+    "category_enum": 1,
+    "status": 0,
+    "incident_time": "2026-01-01T12:00:00Z",
+    "created_at": "2026-01-01T12:01:00Z",
+    "approved": True,
+    "small_thumbnail": None,
+    "unknown_field": "ignored",
+}
+
+ENCODERS = [msgspec.msgpack.encode, orjson.dumps]
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_decodes_well_formed_feed(encode):
+    reports = _decode_feed(encode([GOOD]))
+    assert len(reports) == 1
+    assert reports[0].id == 42
+    assert _extract_coords(reports[0]) == (44.97, -93.26)
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+@pytest.mark.parametrize("field, value", [
+    ("approved", 1),
+    ("status", "1"),
+    ("category_enum", 1.0),
+    ("location", [1, 2]),
+    ("incident_time", 1767268800),
+])
+def test_off_type_field_does_not_drop_the_feed(encode, field, value):
+    odd = dict(GOOD, id=7, **{field: value})
+    reports = _decode_feed(encode([odd, GOOD]))
+    assert [r.id for r in reports] == [7, 42]
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_non_map_record_is_skipped_alone(encode):
+    reports = _decode_feed(encode([None, GOOD, "junk", 3]))
+    assert [r.id for r in reports] == [42]
+
+
+@pytest.mark.parametrize("body", [b"", b"   ", b"\xc1", b'{"error": "x"}', b"[1,"])
+def test_undecodable_body_returns_none(body):
+    assert _decode_feed(body) is None
+
+
+def test_enum_label_tolerates_off_types():
+    assert _enum_label(CATEGORY_LABELS, 1) == "Active"
+    assert _enum_label(CATEGORY_LABELS, 1.0) == "Active"
+    assert _enum_label(CATEGORY_LABELS, "1") == "Unknown"
+    assert _enum_label(CATEGORY_LABELS, [1]) == "Unknown"
+
+
+def test_locale_mask_falls_back_when_one_coordinate_is_bad():
+    collector = IceoutCollector(Config(), asyncio.Queue())
+    data = [
+        # Longitude unusable: no half-filled row, description decides
+        IceoutReport(id=1, location={"coordinates": ["east", 44.97]},
+                     location_description="Lake St, Minneapolis"),
+        IceoutReport(id=2, location={"coordinates": [-93.26, 44.97]}),
+        # Coordinates win over the description when both are usable
+        IceoutReport(id=3, location={"coordinates": [-80.0, 30.0]},
+                     location_description="Minneapolis"),
+    ]
+
+    mask, lats, lons = collector._locale_mask(data)
+
+    assert mask.tolist() == [True, True, False]
+    assert lats[0] != lats[0] and lons[0] != lons[0]  # both NaN
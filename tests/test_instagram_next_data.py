@@ -0,0 +1,34 @@
+"""Instagram __NEXT_DATA__ parsing."""
+
+import asyncio
+
+from collectors.instagram_collector import InstagramCollector
+from config import Config
+
+
+def _timeline(*captions):
+    return {"edge_owner_to_timeline_media": {"edges": [
+        {"node": {
+            "id": f"p{i}",
+            "shortcode": f"sc{i}",
+            "edge_media_to_caption": {"edges": [{"node": {"text": text}}]},
+            "taken_at_timestamp": 1767268800,
+        }}
+        for i, text in enumerate(captions)
+    ]}}
+
+
+def test_timeline_found_below_large_shallow_edge_lists():
+    collector = InstagramCollector(Config(), asyncio.Queue())
+    related = {"edges": [{"node": {"id": f"u{i}", "username": f"user{i}"}}
+                         for i in range(40)]}
+    data = {"props": {
+        "related_profiles": related,
+        "page": {"graphql": {"user": _timeline(
+            "ICE agents detained a man in Minneapolis this morning",
+        )}},
+    }}
+
+    posts = collector._parse_next_data(data, "someone", lambda _id: True)
+
+    assert [p.id for p in posts] == ["p0"]
@@ -0,0 +1,91 @@
+"""StopICE map-data parsing."""
+
+import random
+from html.parser import HTMLParser
+
+import pytest
+
+from collectors.stopice_collector import _MarkerStream, _marker_coords
+
+
+class _ReferenceParser(HTMLParser):
+    """The HTMLParser-based parser _MarkerStream replaced."""
+
+    TAGS = {
+        "id", "lat", "long", "location", "timestamp",
+        "comments", "priorityimg", "thispriority", "media", "map_data",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.markers = []
+        self.marker = {}
+        self.tag = None
+        self.data = ""
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.TAGS:
+            self.tag = tag
+            self.data = ""
+
+    def handle_endtag(self, tag):
+        if tag == self.tag:
+            if self.data.strip():
+                self.marker[tag] = self.data.strip()
+            if tag == "map_data" and self.marker:
+                self.markers.append(self.marker.copy())
+                self.marker = {}
+            self.tag = None
+            self.data = ""
+
+    def handle_data(self, data):
+        if self.tag:
+            self.data += data
+
+
+def _random_response(rng: random.Random) -> str:
+    values = [
+        "", "  ", "44.9778", "-93.2650", "Minneapolis, MN",
+        "2026-01-01 10:30:00", "ICE at Lake &amp; Chicago",
+        "two vans<br>seen &quot;heading north&quot;", "caf&eacute; &#8212; 5",
+        "\n  spaced  \n", "high",
+    ]
+    parts = []
+    for _ in range(rng.randint(0, 30)):
+        for tag in rng.sample(sorted(_ReferenceParser.TAGS - {"map_data"}), 4):
+            name = tag.upper() if rng.random() < 0.1 else tag
+            parts.append(f"<{name}>{rng.choice(values)}</{name}>")
+            parts.append(rng.choice(["", "\n", "  "]))
+        parts.append(f"<map_data>{rng.choice(values)}</map_data>\n")
+    return "".join(parts)
+
+
+def test_matches_reference_parser_with_random_chunking():
+    rng = random.Random(0)
+    for _ in range(200):
+        text = _random_response(rng)
+        ref = _ReferenceParser()
+        ref.feed(text)
+        ref.close()
+
+        stream = _MarkerStream()
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 64)
+            stream.feed(text[pos:pos + step])
+            pos += step
+
+        assert stream.markers == ref.markers
+
+
+@pytest.mark.parametrize("marker, expected", [
+    ({"lat": "44.97", "long": "-93.26"}, (44.97, -93.26)),
+    ({"lat": "44.97"}, None),
+    ({"lat": "north", "long": "-93.26"}, None),
+])
+def test_marker_coords(marker, expected):
+    lat, lon = _marker_coords(marker)
+    if expected is None:
+        assert lat != lat and lon != lon  # NaN
+    else:
+        assert (lat, lon) == expected